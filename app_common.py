@@ -0,0 +1,77 @@
+"""Cached loaders and display helpers shared by the app's pages.
+
+Only the data stack (pandas/numpy via ``pipeline``) is imported here; the
+plotting libraries are imported by the page modules in ``app_pages`` that
+use them, so a page that draws nothing never loads them.
+"""
+import os
+
+import streamlit as st
+
+import data_store
+import metrics
+import pipeline
+import warmup
+
+SOURCES = ['SS.xlsx', 'Bio.xlsx']
+
+
+# Workbooks are read through the columnar cache in data_store. A version
+# names the exact workbook contents it was built from, so loading an older
+# version after the files change still returns that version's data.
+# The loaders use cache_resource so every session shares one read-only frame
+# instead of unpickling its own copy; nothing modifies the frames in place
+@st.cache_resource(max_entries=8)
+def load_raw(path, version):
+    metrics.miss('load_raw')
+    return data_store.load_table(path, digest=data_store.version_sources(version)[os.path.abspath(path)])
+
+
+@st.cache_resource(max_entries=4)
+def load_data(version):
+    metrics.miss('load_data')
+    return pipeline.build_dataset(load_raw('SS.xlsx', version), load_raw('Bio.xlsx', version), version)
+
+
+# Seasons/positions ingested with ingest.py; only the partitions matching the
+# sidebar filters are read
+@st.cache_resource(max_entries=4)
+def load_store_data(version, seasons, positions):
+    metrics.miss('load_data')
+    hockey = data_store.read_partitions(data_store.partitions('stats', seasons, positions))
+    bio = data_store.read_partitions(data_store.partitions('bio', seasons, positions))
+    return pipeline.build_dataset(hockey, bio, version)
+
+
+# Everything the Dataset Overview page derives from df, built once per dataset
+# version. cache_resource hands back the same objects instead of a pickled
+# copy, so they must be treated as read-only; max_entries bounds it to the
+# few most recent versions
+@st.cache_resource(max_entries=4)
+def overview_artifacts(version, _data):
+    metrics.miss('overview')
+    return pipeline.overview(_data)
+
+
+# One warmer per process, shared by every session: it rebuilds and warms the
+# workbook dataset in the background whenever a source file changes, and
+# serving() only moves to the new version once all its artifacts are cached
+@st.cache_resource
+def warmer():
+    w = warmup.Warmer(load_data, lambda frame, version: [
+        ('overview', lambda: overview_artifacts(version, frame))])
+    w.watch(lambda: data_store.dataset_version(SOURCES))
+    return w
+
+
+def show_chart(fig, name):
+    # Serialising the figure a second time costs about as much as sending it,
+    # so payload sizes are only measured while the Performance panel is open
+    if st.session_state.get('show_perf'):
+        metrics.payload(name, len(fig.to_json()))
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def show_image(image, name):
+    metrics.payload(name, len(image))
+    st.image(image, use_container_width=True)
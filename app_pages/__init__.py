@@ -0,0 +1,28 @@
+"""One module per sidebar page, imported the first time its page is shown.
+
+Each module defines ``render(load)``; ``load()`` returns ``(df, version)``
+and is only called by pages that need the merged dataset, so static pages
+load neither the data nor the plotting libraries.
+"""
+import importlib
+
+import metrics
+
+PAGES = {
+    "**About this App**": 'about',
+    "Dataset Overview": 'dataset_overview',
+    "Class Imbalance": 'class_imbalance',
+    "Missing Values": 'missing_values',
+    "Correlation Analysis": 'correlation_analysis',
+    "Scatter Plots": 'scatter_plots',
+    "Similar Players": 'similar_players',
+    "Predicting Points": 'predicting_points',
+    "**Wrapping Up**": 'wrapping_up',
+}
+
+
+def page(label):
+    """The module for the page called ``label``; the first import is timed as ``import:<module>``."""
+    name = f'{__name__}.{PAGES[label]}'
+    with metrics.timer(f'import:{PAGES[label]}'):
+        return importlib.import_module(name)
@@ -0,0 +1,20 @@
+import streamlit as st
+
+
+def render(load):
+    st.markdown("""
+        <div style="background-color:#f0f2f6;padding:32px 24px 24px 24px;border-radius:12px;margin-bottom:24px;">
+            <h2 style="color:#1a202c;margin-bottom:8px;">Get ready for Puck Drop!</h2>
+            <p style="font-size:1.1rem;color:#444;line-height:1.6;margin-bottom:18px;">
+                The main focus of this project is to use <b>Initial Data Analysis (IDA)</b> and <b>Exploratory Data Analysis (EDA)</b> to preprocess two raw datasets containing NHL defenseman data from the last year.<br><br>
+                The goal is to get the data to a point where we can see who is producing the most points and what features correlate with point production. This will set the stage for my semester-end project: <b>predicting points using linear regression</b>.
+            </p>
+            <ul style="font-size:1.05rem;color:#333;margin-left:1.2em;">
+                <li>You will find <b>interactive graphs</b> throughout the app to help you explore the data.</li>
+                <li>There are <b>dropdown text boxes</b> on each page, providing explanations and insights for every analysis.</li>
+            </ul>
+            <div style="margin-top:24px;color:#888;font-size:0.98rem;">
+                <i>Created by <b>Keshavi Dave</b> for her CMSE Midterm Project</i>
+            </div>
+        </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,61 @@
+import plotly.express as px
+import streamlit as st
+
+import query
+from app_common import show_chart
+
+
+def render(load):
+    df, data_version = load()
+    st.header("Class Imbalance Analysis")
+    # Team is available as a filter but has too many values to chart
+    categorical_cols = [col for col in query.GROUP_COLS if col in df.columns and col != 'Team']
+
+    options = categorical_cols
+    if not options:
+        st.info("No categorical columns available.")
+    else:
+        selected_cat = st.selectbox("Select Category:", options)
+        # Cross-filter by any other category; summaries are cached per
+        # filter combination
+        filter_cols = [col for col in query.GROUP_COLS if col in df.columns and col != selected_cat]
+        filters = {}
+        with st.expander("**Filter by other categories**", expanded=False):
+            filter_columns = st.columns(len(filter_cols)) if filter_cols else []
+            for col, container in zip(filter_cols, filter_columns):
+                with container:
+                    filters[col] = st.multiselect(col, query.options(df, data_version, col), key=f"imbalance_{col}")
+        summary = query.summary(df, data_version, selected_cat, filters)
+        if summary.empty:
+            st.info("No players match the selected filters.")
+            return
+        # Charts side by side
+        chart_col1, chart_col2 = st.columns(2)
+        with chart_col1:
+            fig = px.bar(
+                x=summary[selected_cat].astype(str), y=summary['Count'], color=summary[selected_cat].astype(str),
+                labels={'x': selected_cat, 'y': 'Count'},
+                title=f'{selected_cat} Distribution'
+            )
+            show_chart(fig, 'class_imbalance_bar')
+        with chart_col2:
+            fig = px.pie(values=summary['Count'], names=summary[selected_cat].astype(str), hole=0.3,
+                         title=f'{selected_cat} Proportion')
+            show_chart(fig, 'class_imbalance_pie')
+        st.markdown(f"**Point production by `{selected_cat}`**")
+        st.dataframe(summary, use_container_width=True, hide_index=True)
+    st.write("Click on the dropdown below that dives more into the category chosen above in the graphs")
+    with st.expander("**`S/C` - Skater Shoots**", expanded=False):
+        st.markdown("""
+        A little bit more of the Defensemen in the league shoot left than right, this doesn't nessicariarly impact how many points they get in the season, rather just a fun category to see if there are any differences between those who favor to shoot left or right.
+        """)   
+    with st.expander("**`Ctry` - Player's Represented Country**", expanded=False):
+        st.markdown("""
+        Here we can see more clearly that the majority of Defensemen in the league come from the US or Canada, closly followed up by Sweden and Russia. We will most likely see that the top producing Defensemen will come from those top 3-5 countries rather than countries represented with a smaller number of Defensemen.
+        - I.E. Defensemen that perform the best will most likely come from a small subset of countries, instead of being spread across the different countries represented in the NHL.
+        """)   
+    with st.expander("**`Div` & `Conf` - Player's Division & Conference**", expanded=False):
+        st.markdown("""
+        These values are the most evenly distributed, as they are based off of the team the player is on. There are 16 teams in each division, and 8 teams in each conference, so we would expect to see a more even distribution here.
+        - We may be able to see what parts of the NHL produce the best Defensemen by categorizing by Division and Conference. But we expect it to even out due to the nature of how the league is split up.
+        """)
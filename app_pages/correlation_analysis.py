@@ -0,0 +1,26 @@
+import streamlit as st
+
+import correlation
+import figures
+from app_common import show_image
+
+
+def render(load):
+    df, data_version = load()
+    st.header("Correlation Analysis")
+    method = st.selectbox("Correlation method:", correlation.METHODS,
+                          format_func=str.capitalize, key="corr_method")
+    show_image(figures.correlation_image(df, data_version, method), 'correlation_heatmap')
+    with st.expander("**Why do we need Correlation Analysis?**", expanded=False):
+        st.markdown("""
+        This heatmap helps I as the analyst identify strong relationships between the number of Points (`P`) a player records in a season; so that for my final project of the semester, I am able to run regression and prediction tests using the right features that have a strong correlation with each other
+        """)
+    with st.expander("**What do we see here that's helpful?**", expanded=False):
+        st.markdown("""
+        As we are using Points (`P`) as our target variable, we can see that the features that correlate the most are Assists (`A`) and Even Strength Points (`EVP`).
+
+        I will continue to keep these features in mind for my final project when it comes to my regression and prediction Tests
+        - Assists are potentially highly correlated with Points as playing on Defense is not the top position to score the most goals. Rather they are the ones that help to set up most of the goals shot in by a Forward. Hense why many of their Points come from Assists
+        - In addition, it would also make sense as to why there is a high correlation between Points and Even Strength Points as any time a team is up one skater (on the power play) or down one skater (on the penality kill), the Defenseman is spending more time making sure other players don't interfere with the Offencemen and their scoring channces
+            - A Defenseman works best on getting Points when the whole team is on the ice, working together
+        """)
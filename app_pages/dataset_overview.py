@@ -0,0 +1,126 @@
+import pandas as pd
+import streamlit as st
+
+import data_store
+import metrics
+from app_common import SOURCES, load_raw, overview_artifacts
+
+
+def render(load):
+    df, data_version = load()
+    st.header("Dataset Overview")
+    with metrics.cached_call('overview'):
+        overview = overview_artifacts(data_version, df)
+
+    # Metric boxes with gray stripes
+    metric_col1, metric_col2, metric_col3 = st.columns(3)
+    with metric_col1:
+        st.markdown('<div style="display:flex;align-items:center;background:#fff;border-radius:8px;box-shadow:0 1px 4px #e5e7eb;margin-bottom:8px;">'
+                    '<div style="width:8px;height:48px;background:#e5e7eb;border-radius:8px 0 0 8px;margin-right:12px;"></div>'
+                    '<div style="padding:8px 0;">'
+                    f'<div style="font-size:1.1rem;color:#444;">Total Defensemen (entries)</div>'
+                    f'<div style="font-size:1.7rem;font-weight:600;color:#1a202c;">{overview["rows"]}</div>'
+                    '</div></div>', unsafe_allow_html=True)
+    with metric_col2:
+        st.markdown('<div style="display:flex;align-items:center;background:#fff;border-radius:8px;box-shadow:0 1px 4px #e5e7eb;margin-bottom:8px;">'
+                    '<div style="width:8px;height:48px;background:#e5e7eb;border-radius:8px 0 0 8px;margin-right:12px;"></div>'
+                    '<div style="padding:8px 0;">'
+                    f'<div style="font-size:1.1rem;color:#444;">Total Features</div>'
+                    f'<div style="font-size:1.7rem;font-weight:600;color:#1a202c;">{overview["features"]}</div>'
+                    '</div></div>', unsafe_allow_html=True)
+    with metric_col3:
+        st.markdown('<div style="display:flex;align-items:center;background:#fff;border-radius:8px;box-shadow:0 1px 4px #e5e7eb;margin-bottom:8px;">'
+                    '<div style="width:8px;height:48px;background:#e5e7eb;border-radius:8px 0 0 8px;margin-right:12px;"></div>'
+                    '<div style="padding:8px 0;">'
+                    f'<div style="font-size:1.1rem;color:#444;">Total Missing Values</div>'
+                    f'<div style="font-size:1.7rem;font-weight:600;color:#1a202c;">{overview["missing"]}</div>'
+                    '</div></div>', unsafe_allow_html=True)
+
+    st.subheader("Original Datasets")
+    # The previews come from the same workbook contents as the combined data
+    # being served; in store mode that isn't a workbook version, so they
+    # show the workbooks as they are now
+    workbook_version = (data_version if data_store.version_sources(data_version)
+                        else data_store.dataset_version(SOURCES))
+    with metrics.cached_call('load_raw'):
+        bio = load_raw('Bio.xlsx', workbook_version)
+        hockey = load_raw('SS.xlsx', workbook_version)
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("**Bio Stats** `(Bio.xlsx)`")
+        st.dataframe(bio, use_container_width=True, height=320)
+    with col2:
+        st.markdown("**Season Stats** `(SS.xlsx)`")
+        st.dataframe(hockey, use_container_width=True, height=320)
+
+    # Dropdown for raw data info
+    with st.expander("**About The Raw Data**", expanded=False):
+        st.markdown("""
+        - [Bio Stats](https://www.nhl.com/stats/skaters?report=bios&reportType=season&seasonFrom=20242025&seasonTo=20242025&gameType=2&position=D&sort=a_skaterFullName&page=0&pageSize=100) & [Season Stats](https://www.nhl.com/stats/skaters?reportType=season&seasonFrom=20242025&seasonTo=20242025&gameType=2&position=D&sort=skaterFullName&page=2&pageSize=100) pulled from _nhl.com/stats_ from the 2024-25 regular season
+        - Much of the missing data comes from `FOW%` and the categories associated with being drafted into the NHL (`Draft Yr`, `Round`, `Overall`), we will cover this more on the Missing Values page
+        - **Bio Stats**: 
+            - `S/C` - Skater Shoots (Left or Right)
+            - `S/P` - Player Birth State/Provence (US/CAN)
+            - `Ht` - Height (inches)
+            - `Wt` - Weight (lbs)
+            - `HOF` - Yes/No if player is in the Hall of Fame
+            - `GP` - Games Played
+            - `G` - Goals
+            - `A` - Assists
+            - `P` - Points (Goals + Assists)
+
+        - **Season Stats:**
+            - `+/-` - Plus/Minus (goal differential)
+            - `PIM` - Penalty Minutes
+            - `P/GP` - Points per Game Played
+            - `EVG` - Even Strength Goals
+            - `EVP` - Even Strength Points
+            - `PPG` - Power Play Goals
+            - `PPP` - Power Play Points
+            - `SHG` - Shorthanded Goals
+            - `SHP` - Shorthanded Points
+            - `OTG`	- Overtime Goals
+            - `GWG` - Game Winning Goals
+            - `S` - Shots on Goal
+            - `S%` - Shooting Percentage
+            - `TOI/GP` - Time On Ice per Game Played
+            - `FOW%` - Face Off Win Percentage
+        """)
+
+    # Small legend table showing the encodings applied to the Combined Dataset view
+    enc_info = {
+        'Feature': ['S/C', 'Div', 'Conf'],
+        'Encoding': [
+            'L → 0, R → 1',
+            'MET → 1, ATL → 2, CEN → 3, PAC → 4',
+            'EC → 0, WC → 1'
+        ]
+    }
+    enc_df = pd.DataFrame(enc_info)
+    st.markdown("**Encoding Legend**")
+    st.table(enc_df)
+
+    st.subheader("Combined Dataset")
+    # Display a view where S/C is encoded: L -> 0, R -> 1
+    # and add encoded versions of Div and Conf as Div_En and Conf_En
+    st.dataframe(overview['view'], use_container_width=True, height=320)
+
+    # Dropdown for combined data info
+    with st.expander("**How is this more useful, and what's changed?**", expanded=False):
+        st.markdown("""
+        - The two raw datasets have been merged to be used for analysis.
+        - **Taken from Bio Stats:** `Ctry`, `Ht`, `Wt`, `Draft Yr`, `Round`, and `Overall`
+        - **Taken from Season Stats:** All features except for `Season`, `Pos`, and `S%`
+        - Additional features such as `Div` (Division player is in based off of `Team`: Metro, Pacific, Atlantic, Central) and `Conf` (Conference player is in based off of `Div`: Eastern or Western), have been added for additional categorization
+        - For housekeeping, players recorded with more than 2 teams were cleaned to only show the team they ended their season with
+        - `TOI/GP` has been converted from minutes:seconds to seconds so it can be used as a numeric feature
+    - `S/C`, `Div`, and `Conf` have all been been encoded to numeric values for easier analysis
+        """)
+
+    st.subheader("Data Types and Summary Stats")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.dataframe(overview['dtypes'], hide_index=True)
+        st.caption(f"Total in memory: {overview['memory_kb']:,.1f} KB")
+    with col2:
+        st.dataframe(overview['summary'])
@@ -0,0 +1,53 @@
+import streamlit as st
+
+import figures
+import imputation
+from app_common import show_image
+
+
+def render(load):
+    df, data_version = load()
+    st.header("Missing Values Analysis")
+
+    tab1, tab2 = st.tabs(["Missing Values Overview", "Imputation"])
+
+    # --- TAB 1: Existing Missing Values Visualization ---
+    with tab1:
+        show_image(figures.missing_image(df, data_version), 'missing_heatmap')
+
+        with st.expander("**There is a reason as to why we're missing values...**", expanded=False):
+            st.markdown("""
+            - Faceoffs are generally not taken by defensemen, rather forwards  
+               - They will only take the faceoff if the referee has waived off all the forwards on the ice.
+            - It is not mandatory to be drafted by the NHL to play in the league.  
+               - There will always be a handful of players who come into the league straight out of College or from a different hockey league.
+            """)
+
+    # --- TAB 2: Imputation ---
+    with tab2:
+        strategy = st.selectbox("Imputation strategy:", list(imputation.STRATEGIES), key="impute_strategy")
+        st.subheader(f"Imputation of Missing Values - {strategy}")
+        # Columns to impute
+        cols_to_impute = imputation.DEFAULT_COLS
+
+        # --- Show correlation heatmaps before and after imputation ---
+        # Imputed frames, correlations and images are all cached per data
+        # version and strategy, so switching strategies is a lookup once each
+        # has been rendered
+        show_image(figures.imputation_image(df, data_version), 'imputation_heatmap_original')
+        show_image(figures.imputation_image(df, data_version, strategy, cols_to_impute), 'imputation_heatmap_imputed')
+
+        with st.expander("**What changed after imputation?**", expanded=False):
+            st.markdown("""
+            The reason it doesn’t look like much has changed after imputation is because, quite frankly, not much has. Sports data, especially draft and performance data, is complex and often doen't bode well with general statistical fixes. If we could accurately “fill in the blanks” for missing sports data, the entire sports gambling industry would be in shambles.
+
+            Whichever strategy fills the missing values in `Draft Yr`, `Round`, and `Overall`, it estimates them from the players we already have, which pulls them toward typical values and smooths out any extremes. However, in reality, there’s a wide distribution of players drafted across all rounds (1–7), and averaging these numbers flattens that diversity.  
+
+            So overall, this means the imputed values aren't adding any new information, it's just “evening the playing field” for analysis purposes, helping us keep the data complete for modeling without introducing strong bias.
+            """)
+        with st.expander("**Another Imputation Technique: Ignoring the missing values**", expanded=False):
+            st.markdown("""
+            In terms of my overall semester project, having missing values for `Draft Yr`, `Round`, `Overall`, and `FOW%` isn’t a major concern. These features don’t strongly correlate with predicting the number of points a defenseman earns in a season, especially when compared to numerical variables like Assists and Even Strength Points that have a much more direct impact on performance.
+
+            For the purposes of my analysis, I’ll be using a much simpler imputation strategy: _ignoring these columns altogether_. Since they contribute little value to the overall narrative of my project, removing them allows me to focus on the features that truly drive on-ice production and point prediction.
+            """)
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import interactive
+import modeling
+from app_common import show_chart
+
+
+def render(load):
+    df, data_version = load()
+    st.header("Predicting Points")
+    st.write("Fit a linear model for Points (`P`) from any set of numeric features")
+    feature_options = [col for col in df.select_dtypes(include=[np.number]).columns if col != modeling.TARGET]
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        model_kind = st.selectbox("Model:", modeling.MODELS, key="model_kind")
+    with col2:
+        alpha = st.number_input("Penalty (alpha):", min_value=0.0, value=modeling.DEFAULT_ALPHA, step=0.05,
+                                disabled=model_kind == "OLS", key="model_alpha")
+    with col3:
+        n_folds = st.slider("Cross-validation folds:", 2, 10, modeling.DEFAULT_FOLDS, key="model_folds")
+    features = st.multiselect(
+        "Features:", feature_options,
+        default=[col for col in modeling.DEFAULT_FEATURES if col in feature_options], key="model_features"
+    )
+
+    need = modeling.min_rows(len(features), n_folds)
+    rows = modeling.complete_rows(df, features) if features else 0
+    if not features:
+        st.info("Select at least one feature.")
+    elif rows < need:
+        st.info(f"Only {rows} players have every selected feature; {n_folds}-fold cross-validation needs "
+                f"at least {need}. Pick features with fewer missing values or use fewer folds.")
+    else:
+        # Fits and CV results are cached per feature set and data version
+        model = modeling.fit(df, features, kind=model_kind, alpha=alpha, version=data_version)
+        cv = modeling.cross_validate(df, features, kind=model_kind, alpha=alpha, k=n_folds, version=data_version)
+
+        metric_col1, metric_col2, metric_col3 = st.columns(3)
+        metric_col1.metric("Mean CV R²", f"{cv['scores']['R2'].mean():.3f}")
+        metric_col2.metric("Mean CV RMSE", f"{cv['scores']['RMSE'].mean():.2f}")
+        metric_col3.metric("Rows used", model['rows'])
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("**Coefficients**")
+            st.dataframe(modeling.coefficients(model), use_container_width=True)
+            st.markdown("**Scores per fold**")
+            st.dataframe(cv['scores'], use_container_width=True)
+        with col2:
+            pred_df = pd.DataFrame({'Actual P': cv['actual'], 'Predicted P': cv['predicted']})
+            fig = interactive.scatter(pred_df, 'Actual P', 'Predicted P',
+                                      title="Out-of-fold Predicted vs Actual Points")
+            show_chart(fig, 'modeling_predictions')
+
+    with st.expander("**How does this work?**", expanded=False):
+        st.markdown("""
+        - Rows missing any selected feature (or `P`) are left out of the fit
+        - **OLS** is ordinary least squares; **Ridge** and **Lasso** add a penalty on the size of the coefficients, which helps when features overlap (like `A`, `EVP` and `PPP`)
+        - The scores come from k-fold cross-validation: each fold is predicted by a model that never saw it, so R² here is an honest estimate of how well the model predicts new players
+        - Try `A` and `EVP` first, since those were the features most correlated with `P` on the Correlation Analysis page
+        """)
@@ -0,0 +1,77 @@
+import numpy as np
+import streamlit as st
+
+import figures
+import interactive
+import similarity
+from app_common import show_chart, show_image
+
+
+def render(load):
+    df, data_version = load()
+    st.header("Scatter Plots")
+    st.write("Explore Relationships Between Features")
+    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+
+    tab1, tab2 = st.tabs(["Interactive Scatter Plot", "Pairplot"])
+
+    with tab1:
+        col1, col2 = st.columns(2)
+        with col1:
+            x_axis = st.selectbox("Select X-axis:", numeric_cols, key="scatter_x")
+        with col2:
+            y_axis = st.selectbox("Select Y-axis:", numeric_cols, index=min(1, len(numeric_cols)-1), key="scatter_y")
+
+        allowed_color_cols = [col for col in ['S/C', 'Ctry', 'Div', 'Conf', 'Team'] if col in df.columns]
+        color_by = st.selectbox("Color by (optional):", [None] + allowed_color_cols, key="scatter_color")
+        hover_cols = [col for col in ['Player', 'Team', 'GP', 'P', 'Ctry', 'Div', 'Conf'] if col in df.columns]
+        highlighted = None
+        if 'Player' in df.columns and any(col in df.columns for col in similarity.FEATURES):
+            labels, order = similarity.labels(df, data_version)
+            highlighted = st.selectbox("Highlight comparables of (optional):", [None] + order,
+                                       format_func=lambda i: "None" if i is None else labels[i],
+                                       key="scatter_highlight")
+        # Switches to WebGL and then to server-side binning as the row count grows
+        fig = interactive.scatter(df, x_axis, y_axis, color=color_by, hover=hover_cols)
+        if highlighted is not None:
+            # Nearest players on the standardized stats of the Similar Players page
+            comparables = similarity.similar(df, data_version, highlighted)
+            interactive.highlight(fig, df.loc[comparables.index], x_axis, y_axis, "Comparables", label='Player')
+            interactive.highlight(fig, df.iloc[[highlighted]], x_axis, y_axis, labels[highlighted],
+                                  label='Player', symbol='star', size=16)
+        show_chart(fig, 'scatter')
+        with st.expander("**What to do here?**", expanded=False):
+            st.markdown("""
+            This scatter plot allows us to visually explore relationships between different numeric features in the dataset. By selecting different x and y axes, we can see trends, clusters, or outliers that may not be obvious in summary statistics alone. 
+
+            In addition- coloring by categorical variables helps to see how different groups behave in relation to the selected features.
+            """)
+        with st.expander("**What is Class Imbalance doing here?** (_Color by_ tab)", expanded=False):
+            st.markdown("""
+            Earlier we discussed how class imbalance can impact our analysis. In this scatter plot, if we color by a categorical variable that is imbalanced (`Ctry`, `S/C`, `Div`, `Conf`), we see that certain groups dominate the higher points of the plots.
+
+            We wondered if top producing defencemen would all come from a certain class, but as we work through different features against eachother and color them by class- we come to see that at the top of the charts there's always a good bland of defencemen from different Divisions, Confrences, and Shooting Habits
+            - However, in terms of `Ctry`, we do see that the top producing players exclusively only hail from the US, Canada, and Sweden. We were incorrect about assuming there would be more Russians at the top of the chart!
+            """)
+
+    with tab2:
+        st.info("Below are all the possible combinations of features against each other. This tab is here to give a an overall view of how all the numeric features in the dataset relate to each other.")
+        st.subheader("Pairplot (Lower Triangle)")
+        pairplot_mode = st.radio(
+            "Mode:", ["Scatter matrix (interactive)", "Pairplot (static)"],
+            horizontal=True, key="pairplot_mode"
+        )
+        pairplot_cols = st.multiselect(
+            "Features:", numeric_cols, default=numeric_cols[:figures.PAIRPLOT_FEATURES], key="pairplot_cols"
+        )
+        if len(pairplot_cols) > 1:
+            if pairplot_mode == "Scatter matrix (interactive)":
+                # WebGL Splom: all panels are drawn in the browser as one trace,
+                # and large frames are sampled per color group first
+                splom_color = st.selectbox("Color by (optional):", [None] + allowed_color_cols, key="splom_color")
+                fig = interactive.scatter_matrix(df, pairplot_cols, color=splom_color)
+                show_chart(fig, 'scatter_matrix')
+            else:
+                show_image(figures.pairplot_image(df, data_version, pairplot_cols), 'pairplot')
+        else:
+            st.info("Select at least two features for a pairplot.")
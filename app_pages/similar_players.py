@@ -0,0 +1,33 @@
+import streamlit as st
+
+import similarity
+
+
+def render(load):
+    df, data_version = load()
+    st.header("Similar Players")
+    st.write("Find the closest comparables to a defenseman on standardized stats")
+    features = [col for col in similarity.FEATURES if col in df.columns]
+    if 'Player' not in df.columns or not features:
+        st.info("The dataset has no player names or comparison features.")
+        return
+
+    labels, order = similarity.labels(df, data_version)
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        row = st.selectbox("Player:", order, format_func=lambda i: labels[i], key="similar_player")
+    with col2:
+        k = st.slider("Comparables:", 1, 20, similarity.DEFAULT_K, key="similar_k")
+
+    # The KD-tree is built once per data version; each pick is a single query
+    comparables = similarity.similar(df, data_version, row, k=k)
+    st.dataframe(comparables, use_container_width=True, hide_index=True)
+
+    st.caption("To see where they sit, pick the same player under _Highlight comparables of_ on the Scatter Plots page.")
+
+    with st.expander("**How are comparables chosen?**", expanded=False):
+        st.markdown(f"""
+        - Each of {', '.join(f'`{col}`' for col in features)} is standardized (mean 0, standard deviation 1) so no single stat dominates because of its units
+        - Players are compared by straight-line distance across all of those standardized stats; a lower **Distance** means a closer match
+        - Missing values (like `Overall` for undrafted players) count as average for that stat
+        """)
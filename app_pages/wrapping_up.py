@@ -0,0 +1,20 @@
+import streamlit as st
+
+
+def render(load):
+    st.header("Wrapping Up")
+    st.info("**Congratulations!** We have completed an interactive EDA of NHL defensemen data. Here is a summary of what was accomplished in this app:")
+    st.markdown("""
+    - Explored and cleaned two raw datasets (Bio and Season Stats) for NHL defensemen
+    - Investigated missing values and their impact on analysis
+    - Examined class imbalance and its effect on feature distributions
+    - Analyzed feature correlations, focusing on what drives point production
+    - Used interactive scatter plots and pairplots to visualize relationships
+    - Drew insights about which features matter most for predicting points
+
+    **Final Thoughts:**
+    - Assists and Even Strength Points are the most important features for predicting Points among defensemen
+    - Top producing defensemen come from a mix of divisions and conferences, but the highest scorers are mostly from the US, Canada, and Sweden
+    - My data is now ready for regression and prediction modeling for the final project!
+    """)
+    st.info("Thank you for exploring my data! I hope for this to be a valuable part of my work towards Defencemen point predictions.")
@@ -0,0 +1,237 @@
+"""Headless benchmark of every page's compute path on synthetic data.
+
+Usage::
+
+    python benchmark.py --rows 300 10000 1000000 --missing 0.05
+    python benchmark.py --rows 100000 --compare benchmark_results/<old>.json
+
+Generates NHL-shaped season and bio exports (the same columns as ``SS.xlsx``
+and ``Bio.xlsx``), then times each stage the app runs -- loading/merging,
+the Dataset Overview encodings, Class Imbalance counts, correlations,
+heatmap and pairplot rendering, the scatter figure build, and the
+similarity index build plus one query -- recording wall time and peak traced
+memory. Results are written as JSON (one file per run, named after the
+current commit) so they can be compared across commits;
+``--compare`` exits non-zero when a stage is slower than ``--tolerance``
+times the baseline.
+
+``--startup`` records cold-start import time instead (or as well, when
+``--rows`` is also given): the app shell and each page module are imported
+in a fresh interpreter, which is what a new session on a cold container
+pays before the first page renders. It does not include the background
+warm-up that the first data page starts.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+import app_pages
+import correlation
+import figures
+import interactive
+import league
+import pipeline
+import query
+import similarity
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(HERE, 'benchmark_results')
+DEFAULT_ROWS = [300, 10_000, 100_000]
+COUNTRIES = ['CAN', 'USA', 'SWE', 'RUS', 'FIN', 'CZE', 'CHE', 'DEU', 'SVK', 'DNK', 'LVA', 'NOR', 'AUT']
+COUNTRY_WEIGHTS = [0.39, 0.27, 0.10, 0.06, 0.05, 0.04, 0.03, 0.02, 0.015, 0.01, 0.01, 0.0025, 0.0025]
+# Columns that stay complete so the merge keys are always present
+NEVER_MISSING = {'Player', 'Season', 'Team', 'S/C', 'Pos', 'GP', 'G', 'A', 'P'}
+
+
+def synthetic_exports(rows, missing=0.0, seed=0):
+    """``(season_stats, bio)`` frames shaped like ``SS.xlsx`` and ``Bio.xlsx``."""
+    rng = np.random.default_rng(seed)
+    teams = league.TEAMS.loc[league.TEAMS['To'] >= league.CURRENT_SEASON, 'Team'].to_numpy()
+    player = np.char.add('Player ', np.arange(rows).astype(str))
+    team = rng.choice(teams, rows)
+    shoots = rng.choice(['L', 'R'], rows, p=[0.6, 0.4])
+    gp = rng.integers(1, 83, rows)
+    rate = rng.gamma(2.0, 0.12, rows)
+    g = rng.binomial(gp, np.clip(rate * 0.2, 0, 1))
+    a = rng.binomial(gp, np.clip(rate * 0.8, 0, 1))
+    p = g + a
+    ppp = rng.binomial(p, 0.3)
+    ppg = rng.binomial(np.minimum(g, ppp), 0.5)
+    shp = rng.binomial(p - ppp, 0.02)
+    shg = rng.binomial(np.minimum(g - ppg, shp), 0.5)
+    evg = g - ppg - shg
+    evp = p - ppp - shp
+    s = g + rng.poisson(gp * 1.2)
+    toi = rng.normal(18 * 60, 180, rows).clip(300, 1800).astype(int)
+    drafted = rng.random(rows) < 0.8
+
+    season = pd.DataFrame({
+        'Player': player, 'Season': league.CURRENT_SEASON, 'Team': team, 'S/C': shoots, 'Pos': 'D',
+        'GP': gp, 'G': g, 'A': a, 'P': p, '+/-': rng.integers(-30, 31, rows),
+        'PIM': rng.poisson(gp * 0.4), 'P/GP': np.round(p / gp, 2),
+        'EVG': evg, 'EVP': evp, 'PPG': ppg, 'PPP': ppp, 'SHG': shg, 'SHP': shp,
+        'OTG': rng.binomial(g, 0.05), 'GWG': rng.binomial(g, 0.15), 'S': s,
+        'S%': np.round(np.where(s > 0, 100 * g / np.maximum(s, 1), 0), 1),
+        'TOI/GP': [f"{t // 60}:{t % 60:02d}" for t in toi],
+        'FOW%': np.where(rng.random(rows) < 0.05, rng.uniform(0, 100, rows).round(1), np.nan),
+    })
+    bio = pd.DataFrame({
+        'Player': player, 'Team': team, 'S/C': shoots, 'Pos': 'D',
+        'Ctry': rng.choice(COUNTRIES, rows, p=np.divide(COUNTRY_WEIGHTS, sum(COUNTRY_WEIGHTS))),
+        'Ht': rng.normal(73, 2, rows).round().astype(int),
+        'Wt': rng.normal(200, 15, rows).round().astype(int),
+        'Draft Yr': np.where(drafted, rng.integers(2005, 2024, rows), np.nan),
+        'Round': np.where(drafted, rng.integers(1, 8, rows), np.nan),
+        'Overall': np.where(drafted, rng.integers(1, 225, rows), np.nan),
+    })
+    # Shuffle the bio export so the merge has to match by key
+    bio = bio.sample(frac=1.0, random_state=seed).reset_index(drop=True)
+    for frame in (season, bio):
+        for col in frame.columns:
+            if missing and col not in NEVER_MISSING:
+                holes = rng.random(rows) < missing
+                frame[col] = frame[col].where(~holes)
+    return season, bio
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, {'seconds': round(seconds, 4), 'peak_mb': round(peak / 2**20, 2)}
+
+
+def run(rows, missing=0.0, seed=0):
+    """Time every stage on ``rows`` synthetic players; returns ``{stage: measurements}``."""
+    season, bio = synthetic_exports(rows, missing, seed)
+    version = f'bench-{rows}-{missing}-{seed}-{time.time_ns()}'
+    stages = {}
+    with tempfile.TemporaryDirectory() as store_dir:
+        df, stages['load_data'] = _measure(
+            lambda: pipeline.build_dataset(season, bio, version, store_dir=store_dir))
+    _, stages['encodings'] = _measure(lambda: pipeline.overview(df))
+    _, stages['value_counts'] = _measure(lambda: query.summary(df, version, 'Ctry'))
+    corr, stages['corr'] = _measure(lambda: correlation.compute(df))
+    _, stages['heatmap_render'] = _measure(
+        lambda: figures._to_bytes(figures.correlation_heatmap(corr, 'Correlation Matrix'), 'png'))
+    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    _, stages['pairplot'] = _measure(
+        lambda: figures._to_bytes(figures.lower_triangle_pairplot(df, numeric_cols[:6]), 'png'))
+    hover = [c for c in ['Player', 'Team', 'GP', 'P', 'Ctry', 'Div', 'Conf'] if c in df.columns]
+    fig, stages['scatter_build'] = _measure(
+        lambda: interactive.scatter(df, 'A', 'P', color='Div', hover=hover).to_json())
+    stages['scatter_build']['payload_kb'] = round(len(fig) / 1024, 1)
+    _, stages['similarity'] = _measure(lambda: similarity.similar(df, version, 0))
+    return stages
+
+
+def startup(repeat=3):
+    """Best-of-``repeat`` cold import time of the app shell and of each page, in fresh interpreters."""
+    snippet = ("import time; start = time.perf_counter(); import streamlit, app_common, {}; "
+               "print(time.perf_counter() - start)")
+    times = {}
+    for module in ['app_common'] + [f'app_pages.{name}' for name in app_pages.PAGES.values()]:
+        runs = []
+        for _ in range(repeat):
+            proc = subprocess.run([sys.executable, '-c', snippet.format(module)],
+                                  capture_output=True, text=True, cwd=HERE)
+            if proc.returncode:
+                raise RuntimeError(f"importing {module} failed: {proc.stderr.strip().splitlines()[-1]}")
+            runs.append(float(proc.stdout.split()[-1]))
+        times[module] = {'seconds': round(min(runs), 4)}
+    return times
+
+
+def _commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True, cwd=HERE).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def compare(results, baseline, tolerance):
+    """Print per-stage ratios against ``baseline``; returns the list of regressions."""
+    regressions = []
+    old_runs = {(r['rows'], r['missing']): r['stages'] for r in baseline['runs']}
+    for run_ in results['runs']:
+        old = old_runs.get((run_['rows'], run_['missing']))
+        if old is None:
+            continue
+        for stage, now in run_['stages'].items():
+            if stage not in old or not old[stage]['seconds']:
+                continue
+            ratio = now['seconds'] / old[stage]['seconds']
+            flag = ' REGRESSION' if ratio > tolerance else ''
+            print(f"{run_['rows']:>9} {stage:<16} {old[stage]['seconds']:>9.4f}s -> {now['seconds']:>9.4f}s "
+                  f"({ratio:.2f}x){flag}")
+            if flag:
+                regressions.append((run_['rows'], stage, ratio))
+    old_startup = baseline.get('startup', {})
+    for module, now in results.get('startup', {}).items():
+        if module not in old_startup or not old_startup[module]['seconds']:
+            continue
+        ratio = now['seconds'] / old_startup[module]['seconds']
+        flag = ' REGRESSION' if ratio > tolerance else ''
+        print(f"{'startup':>9} {module:<30} {old_startup[module]['seconds']:>9.4f}s -> {now['seconds']:>9.4f}s "
+              f"({ratio:.2f}x){flag}")
+        if flag:
+            regressions.append(('startup', module, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--rows', type=int, nargs='+',
+                        help="synthetic row counts (default 300 10000 100000, or none with --startup)")
+    parser.add_argument('--missing', type=float, default=0.0, help="extra share of missing values per column")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', help="output JSON path (default benchmark_results/<commit>.json)")
+    parser.add_argument('--compare', help="baseline JSON to compare against")
+    parser.add_argument('--tolerance', type=float, default=1.25, help="slowdown ratio counted as a regression")
+    parser.add_argument('--startup', action='store_true', help="time cold imports of the app and each page")
+    args = parser.parse_args(argv)
+
+    commit = _commit()
+    results = {'commit': commit, 'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+               'python': platform.python_version(), 'pandas': pd.__version__, 'runs': []}
+    if args.rows is None:
+        args.rows = [] if args.startup else DEFAULT_ROWS
+    for rows in args.rows:
+        stages = run(rows, args.missing, args.seed)
+        results['runs'].append({'rows': rows, 'missing': args.missing, 'stages': stages})
+        for stage, m in stages.items():
+            print(f"{rows:>9} {stage:<16} {m['seconds']:>9.4f}s {m['peak_mb']:>9.2f} MB")
+    if args.startup:
+        results['startup'] = startup()
+        for module, m in results['startup'].items():
+            print(f"{'startup':>9} {module:<30} {m['seconds']:>9.4f}s")
+
+    out = args.out or os.path.join(RESULTS_DIR, f'{commit}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, 'w') as f:
+        json.dump(results, f, indent=1)
+    print(f"wrote {out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Shared correlation-matrix engine for the heatmap pages.
+
+All pairwise correlations are computed in one pass of matrix products over
+the numeric columns, with pairwise-complete handling of NaNs (each pair uses
+the rows where both values are present, as ``DataFrame.corr`` does).
+Spearman ranks have to be taken over each pair's complete rows, so columns
+are grouped by their missingness pattern and ranked once per pattern (and
+per pair of patterns) rather than once per pair of columns. Results
+are cached per (dataset version, imputation strategy, method); asking for a
+superset of cached columns only computes the new rows/columns of the matrix.
+"""
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+import metrics
+from lru import LRUCache
+
+METHODS = ['pearson', 'spearman', 'kendall']
+MAX_ENTRIES = 32  # two dataset versions' worth, so warming a new one keeps the old warm
+
+_cache = LRUCache('correlation', max_entries=MAX_ENTRIES)
+
+
+def _pairwise(x, y):
+    """Pearson correlation of every column of ``x`` with every column of ``y``, NaN-pairwise."""
+    mx, my = ~np.isnan(x), ~np.isnan(y)
+    x0, y0 = np.where(mx, x, 0.0), np.where(my, y, 0.0)
+    mx, my = mx.astype(float), my.astype(float)
+    n = mx.T @ my
+    sx, sy = x0.T @ my, mx.T @ y0
+    sxx, syy = (x0 * x0).T @ my, mx.T @ (y0 * y0)
+    sxy = x0.T @ y0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = sxy - sx * sy / n
+        var = (sxx - sx * sx / n) * (syy - sy * sy / n)
+        r = cov / np.sqrt(var)
+    r[n < 2] = np.nan
+    return np.clip(r, -1.0, 1.0)
+
+
+def _ranked_pairwise(x):
+    # Average ranks over the given rows; NaN-free by construction
+    r = pd.DataFrame(x).rank().to_numpy()
+    return _pairwise(r, r)
+
+
+def _spearman(x):
+    """Spearman matrix of the columns of ``x``, each pair ranked on its own complete rows."""
+    present = ~np.isnan(x)
+    complete = np.flatnonzero(present.all(axis=0))
+    patterns = {}
+    for j in np.flatnonzero(~present.all(axis=0)):
+        patterns.setdefault(present[:, j].tobytes(), []).append(j)
+    groups = [(present[:, cols[0]], cols) for cols in patterns.values()]
+    out = np.full((x.shape[1],) * 2, np.nan)
+    if len(complete):
+        out[np.ix_(complete, complete)] = _ranked_pairwise(x[:, complete])
+    for a, (rows_a, cols_a) in enumerate(groups):
+        # Within a pattern, and against the complete columns, every pair
+        # shares the same complete rows
+        cols = np.r_[cols_a, complete]
+        block = _ranked_pairwise(x[np.ix_(rows_a, cols)])
+        out[np.ix_(cols_a, cols)] = block[:len(cols_a)]
+        out[np.ix_(cols, cols_a)] = block[:, :len(cols_a)]
+        for rows_b, cols_b in groups[a + 1:]:
+            cols = np.r_[cols_a, cols_b]
+            block = _ranked_pairwise(x[np.ix_(rows_a & rows_b, cols)])
+            out[np.ix_(cols_a, cols_b)] = block[:len(cols_a), len(cols_a):]
+            out[np.ix_(cols_b, cols_a)] = block[len(cols_a):, :len(cols_a)]
+    return out
+
+
+def compute(frame, method='pearson'):
+    """Correlation matrix of the numeric columns of ``frame``."""
+    numeric = frame.select_dtypes(include=[np.number])
+    if method == 'kendall':
+        # No matrix-product form; pandas' O(n^2) per pair implementation
+        return numeric.corr(method='kendall')
+    x = numeric.to_numpy(dtype=float)
+    corr = _spearman(x) if method == 'spearman' else _pairwise(x, x)
+    return pd.DataFrame(corr, index=numeric.columns, columns=numeric.columns)
+
+
+def extend(corr, frame, method='pearson'):
+    """Grow ``corr`` to cover every numeric column of ``frame``, computing only the new ones."""
+    numeric = frame.select_dtypes(include=[np.number])
+    old = [c for c in numeric.columns if c in corr.columns]
+    new = [c for c in numeric.columns if c not in corr.columns]
+    if not new:
+        return corr.loc[old, old]
+    if method != 'pearson' or not old:
+        # Rank-based matrices depend on the rows each pair shares; recompute
+        return compute(numeric, method)
+    x_all = numeric[old + new].to_numpy(dtype=float)
+    block = _pairwise(x_all[:, len(old):], x_all)  # new x (old + new)
+    out = np.empty((len(old) + len(new),) * 2)
+    out[:len(old), :len(old)] = corr.loc[old, old].to_numpy()
+    out[len(old):, :] = block
+    out[:len(old), len(old):] = block[:, :len(old)].T
+    cols = old + new
+    return pd.DataFrame(out, index=cols, columns=cols).loc[numeric.columns, numeric.columns]
+
+
+def correlation(frame, version, strategy='none', method='pearson'):
+    """Cached correlation matrix for ``frame``, the data at ``version`` after ``strategy`` imputation."""
+    key = (version, strategy, method)
+    cached = _cache.get(key)
+    with metrics.timer(f'correlation:{method}'):
+        if cached is None:
+            corr = compute(frame, method)
+        else:
+            corr = extend(cached, frame, method)
+    return _cache.put(key, corr)
+
+
+@lru_cache(maxsize=32)
+def lower_mask(k):
+    """Boolean mask hiding the upper triangle (and diagonal) of a k x k heatmap."""
+    mask = np.triu(np.ones((k, k), dtype=bool))
+    mask.flags.writeable = False
+    return mask
@@ -0,0 +1,262 @@
+"""Columnar on-disk cache for the nhl.com workbooks.
+
+Each source workbook is parsed once and written to a directory of ``.npy``
+files (one per column) plus a ``schema.json``. The directory is keyed on the
+source file's content hash, and a small manifest records the file's mtime and
+size so an unchanged workbook is recognised without re-hashing it. Loads are
+memory-mapped, so a cold process never touches openpyxl once the cache exists.
+
+``dataset_version`` also records which source digests each version is made
+of, so a version can still be loaded after its workbooks have changed on
+disk, from the tables cached for those digests. Only the newest
+``KEEP_VERSIONS`` versions are kept, and tables none of them refer to are
+deleted.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.data_cache')
+MANIFEST = 'manifest.json'
+VERSIONS = 'versions.json'
+KEEP_VERSIONS = 32
+SCHEMA = 'schema.json'
+
+
+def file_digest(path, chunk_size=1 << 20):
+    """SHA-256 of a file's contents, read in chunks."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _read_manifest(cache_dir):
+    try:
+        with open(os.path.join(cache_dir, MANIFEST)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_json(path, obj):
+    # Write next to the target and rename so readers never see a partial file
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(obj, f, indent=1)
+    os.replace(tmp, path)
+
+
+def source_digest(path, cache_dir=CACHE_DIR):
+    """Content hash of ``path``, skipping the hash when mtime and size are unchanged."""
+    st = os.stat(path)
+    key = os.path.abspath(path)
+    entry = _read_manifest(cache_dir).get(key)
+    if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+        return entry['digest']
+    digest = file_digest(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    manifest = _read_manifest(cache_dir)
+    manifest[key] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'digest': digest}
+    _write_json(os.path.join(cache_dir, MANIFEST), manifest)
+    return digest
+
+
+_versions_lock = threading.Lock()
+
+
+def _read_versions(cache_dir):
+    try:
+        with open(os.path.join(cache_dir, VERSIONS)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def dataset_version(paths, cache_dir=CACHE_DIR):
+    """Short version string that changes whenever any of ``paths`` changes."""
+    digests = {os.path.abspath(path): source_digest(path, cache_dir) for path in paths}
+    h = hashlib.sha256()
+    for digest in digests.values():
+        h.update(digest.encode())
+    version = h.hexdigest()[:16]
+    with _versions_lock:
+        versions = _read_versions(cache_dir)
+        if versions.get(version) != digests:
+            versions.pop(version, None)
+            versions[version] = digests
+            # Insertion order is age order; keep the newest few
+            versions = dict(list(versions.items())[-KEEP_VERSIONS:])
+            _write_json(os.path.join(cache_dir, VERSIONS), versions)
+            _prune_tables(versions, cache_dir)
+    return version
+
+
+def _prune_tables(versions, cache_dir):
+    # Remove the cached tables of source digests no kept version refers to,
+    # so a long-running server doesn't keep one table per workbook refresh
+    keep = {os.path.basename(_table_dir(path, digest, cache_dir))
+            for sources in versions.values() for path, digest in sources.items()}
+    for name in os.listdir(cache_dir):
+        _, _, digest = name.rpartition('-')
+        if (name not in keep and len(digest) == 16 and not name.startswith('.')
+                and os.path.isfile(os.path.join(cache_dir, name, SCHEMA))):
+            shutil.rmtree(os.path.join(cache_dir, name), ignore_errors=True)
+
+
+def version_sources(version, cache_dir=CACHE_DIR):
+    """``{absolute path: digest}`` recorded for ``version``, or None if it isn't a known version."""
+    return _read_versions(cache_dir).get(version)
+
+
+def _table_dir(path, digest, cache_dir):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(cache_dir, f'{stem}-{digest[:16]}')
+
+
+def write_table(frame, out_dir):
+    """Write ``frame`` as one ``.npy`` per column plus a JSON schema."""
+    parent = os.path.dirname(out_dir)
+    os.makedirs(parent, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(dir=parent, prefix='.tmp-')
+    columns = []
+    for i, col in enumerate(frame.columns):
+        s = frame[col]
+        entry = {'name': str(col), 'file': f'{i}.npy'}
+        if pd.api.types.is_bool_dtype(s) or pd.api.types.is_numeric_dtype(s):
+            entry['kind'] = 'numeric'
+            arr = s.to_numpy()
+            if arr.dtype == object:
+                # Nullable extension dtypes (Int64, boolean) with missing values
+                arr = s.to_numpy(dtype=float, na_value=np.nan)
+        elif pd.api.types.is_datetime64_any_dtype(s):
+            entry['kind'] = 'datetime'
+            arr = s.to_numpy(dtype='datetime64[ns]').view('int64')
+        else:
+            # Strings (and anything else) become dictionary codes; -1 marks missing
+            entry['kind'] = 'category'
+            cat = pd.Categorical(s.where(s.isna(), s.astype(str)))
+            entry['categories'] = [str(c) for c in cat.categories]
+            arr = cat.codes.astype(np.int32)
+        entry['dtype'] = str(arr.dtype)
+        np.save(os.path.join(tmp_dir, entry['file']), np.ascontiguousarray(arr))
+        columns.append(entry)
+    _write_json(os.path.join(tmp_dir, SCHEMA), {'rows': len(frame), 'columns': columns})
+    if os.path.isdir(out_dir):
+        # Another process converted the same digest first; keep theirs
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    else:
+        os.replace(tmp_dir, out_dir)
+
+
+def read_table(table_dir):
+    """Load a table written by ``write_table``; numeric columns stay memory-mapped."""
+    with open(os.path.join(table_dir, SCHEMA)) as f:
+        schema = json.load(f)
+    data = {}
+    for entry in schema['columns']:
+        arr = np.load(os.path.join(table_dir, entry['file']), mmap_mode='r')
+        if entry['kind'] == 'numeric':
+            data[entry['name']] = arr
+        elif entry['kind'] == 'datetime':
+            data[entry['name']] = np.asarray(arr).view('datetime64[ns]')
+        else:
+            cats = np.array(entry['categories'] + [np.nan], dtype=object)
+            # Code -1 indexes the trailing NaN, so missing values round-trip
+            data[entry['name']] = cats.take(np.asarray(arr))
+    return pd.DataFrame(data, copy=False)
+
+
+def load_table(path, cache_dir=CACHE_DIR, reader=pd.read_excel, digest=None):
+    """Return ``path`` as a DataFrame, converting it into the columnar cache on first use.
+
+    With ``digest``, return the content of ``path`` that had that hash: the
+    cached table if there is one, otherwise the file itself, but only while
+    it still has that content (FileNotFoundError if it has changed since).
+    """
+    current = source_digest(path, cache_dir)
+    digest = digest or current
+    table_dir = _table_dir(path, digest, cache_dir)
+    if not os.path.isfile(os.path.join(table_dir, SCHEMA)):
+        if current != digest:
+            raise FileNotFoundError(f"{path} no longer has content {digest[:12]} and it was never cached")
+        frame = reader(path)
+        # Content that changed mid-read must not be cached under the old digest
+        if source_digest(path, cache_dir) != digest:
+            raise FileNotFoundError(f"{path} changed while it was being read")
+        write_table(frame, table_dir)
+    return read_table(table_dir)
+
+
+# --- Partitioned store ---
+# Written by ingest.py as <store>/<kind>/season=<season>/position=<pos>/<part>/,
+# where each part is a table in the format above. Filters on season and
+# position are applied to the directory names, so unselected partitions are
+# never opened.
+
+STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'store')
+
+
+def _partition_dirs(parent, key):
+    """``(dir name, value)`` of the ``<key>=<value>`` subdirectories of ``parent``, sorted."""
+    out = []
+    for name in sorted(os.listdir(parent)):
+        k, _, value = name.partition('=')
+        # Skips ingest bookkeeping (ingested.json) and anything else stray
+        if k == key and os.path.isdir(os.path.join(parent, name)):
+            out.append((name, value))
+    return out
+
+
+def partitions(kind, seasons=None, positions=None, store_dir=STORE_DIR):
+    """Part directories of ``kind`` matching the season/position filters, in sorted order."""
+    root = os.path.join(store_dir, kind)
+    if not os.path.isdir(root):
+        return []
+    parts = []
+    for season_dir, season in _partition_dirs(root, 'season'):
+        if seasons is not None and season not in seasons:
+            continue
+        for pos_dir, pos in _partition_dirs(os.path.join(root, season_dir), 'position'):
+            if positions is not None and pos not in positions:
+                continue
+            base = os.path.join(root, season_dir, pos_dir)
+            parts.extend(os.path.join(base, p) for p in sorted(os.listdir(base))
+                         if os.path.isfile(os.path.join(base, p, SCHEMA)))
+    return parts
+
+
+def partition_values(kind, key, store_dir=STORE_DIR):
+    """Distinct values of the ``season`` or ``position`` partition key for ``kind``."""
+    root = os.path.join(store_dir, kind)
+    if not os.path.isdir(root):
+        return []
+    values = set()
+    for season_dir, season in _partition_dirs(root, 'season'):
+        if key == 'season':
+            values.add(season)
+        else:
+            values.update(value for _, value in _partition_dirs(os.path.join(root, season_dir), 'position'))
+    return sorted(values)
+
+
+def partitions_version(parts, store_dir=STORE_DIR):
+    """Version string for a set of part directories (their names embed the source hash)."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(os.path.relpath(part, store_dir).encode())
+    return h.hexdigest()[:16]
+
+
+def read_partitions(parts):
+    """Concatenate the tables in ``parts`` (empty frame when there are none)."""
+    if not parts:
+        return pd.DataFrame()
+    return pd.concat([read_table(p) for p in parts], ignore_index=True)
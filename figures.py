@@ -0,0 +1,151 @@
+"""Rendered-figure cache for the matplotlib/seaborn plots.
+
+Figures are drawn once per (dataset version, plot type, parameters), saved to
+PNG bytes and closed straight away, so pyplot never accumulates open figures
+across reruns. Repeat views are served from the cached bytes via
+``st.image``; the cache is an LRU bounded by total size. pyplot's figure
+manager is global and not thread-safe, so drawing and saving are serialised
+across the session threads and the background warmer.
+"""
+import io
+import threading
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+import correlation
+import imputation
+from lru import LRUCache
+
+MAX_BYTES = 64 * 1024 * 1024
+DPI = 200  # matches st.pyplot's default
+
+_cache = LRUCache('figures', max_bytes=MAX_BYTES)
+_pyplot_lock = threading.Lock()
+
+
+def _to_bytes(fig, fmt):
+    buf = io.BytesIO()
+    try:
+        fig.savefig(buf, format=fmt, dpi=DPI, bbox_inches='tight')
+    finally:
+        plt.close(fig)
+    return buf.getvalue()
+
+
+def render(key, draw, *args, fmt='png', **kwargs):
+    """PNG/SVG bytes for ``draw(*args, **kwargs)``, cached under ``key``.
+
+    ``draw`` must return a matplotlib Figure; it is only called on a miss.
+    ``key`` should identify the data version, plot type and parameters.
+    """
+    plot_type = key[1] if isinstance(key, tuple) and len(key) > 1 else 'figure'
+
+    def compute():
+        with _pyplot_lock:
+            return _to_bytes(draw(*args, **kwargs), fmt)
+
+    return _cache.get_or_compute((key, fmt), compute, f'render:{plot_type}')
+
+
+def clear():
+    _cache.clear()
+
+
+# --- Plot types ---
+
+def missing_heatmap(data):
+    fig, ax = plt.subplots(figsize=(min(12, len(data.columns)*0.6), 6))
+    sns.heatmap(data.isnull(), cbar=False, cmap="Blues", yticklabels=False, ax=ax)
+    ax.set_xlabel("Features")
+    ax.set_title("Missing Values Heatmap")
+    return fig
+
+
+def imputation_heatmap(corr, title):
+    fig, ax = plt.subplots(figsize=(12, 8))
+    sns.heatmap(
+        corr, mask=correlation.lower_mask(len(corr)), cmap='RdBu_r', center=0,
+        annot=False, linewidths=.5, cbar_kws={"shrink": .8}, ax=ax
+    )
+    ax.set_title(title)
+    return fig
+
+
+def correlation_heatmap(corr, title):
+    # Make cells rectangular: wider figure, not square
+    fig, ax = plt.subplots(figsize=(max(14, len(corr.columns)*1.2), 12))
+    sns.heatmap(
+        corr,
+        mask=correlation.lower_mask(len(corr)),
+        annot=True,
+        fmt='.2f',
+        cmap='RdBu_r',
+        center=0,
+        square=False,
+        linewidths=.5,
+        cbar_kws={"shrink": .8},
+        annot_kws={"size": 12},
+        ax=ax
+    )
+    ax.set_title(title)
+    ax.tick_params(axis='y', rotation=0)
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    fig.tight_layout()
+    return fig
+
+
+HIST_ROWS = 5000
+PAIRPLOT_FEATURES = 6  # numeric columns selected by default
+
+
+def lower_triangle_pairplot(data, vars):
+    # Past HIST_ROWS the off-diagonal panels become 2D histograms, which cost
+    # the same to draw however many rows there are
+    if len(data) > HIST_ROWS:
+        g = sns.pairplot(
+            data[vars],
+            corner=True,
+            kind='hist',
+            plot_kws={'bins': 40, 'color': 'dodgerblue'},
+            diag_kws={'color': 'dodgerblue', 'edgecolor': 'black'}
+        )
+    else:
+        g = sns.pairplot(
+            data[vars],
+            corner=True,
+            plot_kws={'alpha':0.7, 's':20, 'color':'dodgerblue'},
+            diag_kws={'color':'dodgerblue', 'edgecolor':'black'}
+        )
+    return g.figure
+
+
+# --- Page images ---
+# The cache key, inputs and title of every image a page shows, shared by the
+# pages and by warmup so both land on the same cache entries
+
+def missing_image(data, version):
+    return render((version, 'missing'), missing_heatmap, data)
+
+
+def imputation_image(data, version, strategy='none', cols=imputation.DEFAULT_COLS):
+    """Lower-triangle correlation heatmap of ``data`` after ``strategy`` imputation ('none' for the original)."""
+    if strategy == 'none':
+        return render((version, 'imputation_heatmap', 'none'), lambda: imputation_heatmap(
+            correlation.correlation(data, version),
+            "Original Combined Data - Correlation (Lower Triangle)"))
+    return render((version, 'imputation_heatmap', strategy), lambda: imputation_heatmap(
+        correlation.correlation(imputation.impute(data, version, strategy, cols), version, strategy=strategy),
+        f"Imputed Combined Data ({strategy}) - Correlation (Lower Triangle)"))
+
+
+def correlation_image(data, version, method='pearson'):
+    return render((version, 'correlation_heatmap', method), lambda: correlation_heatmap(
+        correlation.correlation(data, version, method=method),
+        f'{method.capitalize()} Correlation Matrix (Lower Triangle)'))
+
+
+def pairplot_image(data, version, cols):
+    return render((version, 'pairplot', tuple(cols)), lower_triangle_pairplot, data, list(cols))
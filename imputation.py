@@ -0,0 +1,112 @@
+"""Pluggable imputation strategies for the Missing Values page.
+
+Every strategy takes the frame and the columns to fill and returns a new
+frame; they are registered in ``STRATEGIES`` under the label shown in the
+UI. ``impute`` caches results per (dataset version, strategy, columns) so
+switching strategies back and forth is a lookup.
+"""
+import numpy as np
+from scipy.spatial import cKDTree
+
+from lru import LRUCache
+
+DEFAULT_COLS = ['Draft Yr', 'Round', 'Overall']
+KNN_K = 5
+ITERATIONS = 5
+MAX_ENTRIES = 16
+
+_cache = LRUCache('imputation', max_entries=MAX_ENTRIES)
+
+
+def _present(frame, cols):
+    return [c for c in cols if c in frame.columns]
+
+
+def _fill_stat(stat):
+    def fill(frame, cols):
+        out = frame.copy()
+        cols = _present(out, cols)
+        out[cols] = out[cols].fillna(out[cols].agg(stat))
+        return out
+    return fill
+
+
+def _fill_group(by):
+    def fill(frame, cols):
+        out = frame.copy()
+        cols = _present(out, cols)
+        if by not in out.columns:
+            return _fill_stat('mean')(out, cols)
+        group_means = out[cols].groupby(out[by], observed=True).transform('mean')
+        # Groups with no observed value fall back to the column mean
+        out[cols] = out[cols].fillna(group_means).fillna(out[cols].mean())
+        return out
+    return fill
+
+
+def _complete_features(frame, exclude):
+    numeric = frame.select_dtypes(include=[np.number])
+    feats = numeric.drop(columns=[c for c in exclude if c in numeric.columns])
+    feats = feats.loc[:, feats.notna().all()]
+    x = feats.to_numpy(dtype=float)
+    std = x.std(axis=0)
+    keep = std > 0
+    return (x[:, keep] - x[:, keep].mean(axis=0)) / std[keep]
+
+
+def knn(frame, cols, k=KNN_K):
+    """Mean of the ``k`` nearest donors on the standardised complete numeric columns."""
+    out = frame.copy()
+    cols = _present(out, cols)
+    x = _complete_features(out, cols)
+    if x.shape[1] == 0:
+        return _fill_stat('mean')(out, cols)
+    for col in cols:
+        values = np.array(out[col], dtype=float)
+        missing = np.isnan(values)
+        if not missing.any() or missing.all():
+            continue
+        # KD-tree over the donors, queried once for all recipients
+        tree = cKDTree(x[~missing])
+        kk = min(k, int((~missing).sum()))
+        _, idx = tree.query(x[missing], k=kk)
+        donors = values[~missing]
+        values[missing] = donors[np.asarray(idx).reshape(len(idx), -1)].mean(axis=1)
+        out[col] = values
+    return out
+
+
+def iterative(frame, cols, iterations=ITERATIONS):
+    """Round-robin least-squares regression of each column on the others, starting from means."""
+    out = _fill_stat('mean')(frame, cols)
+    cols = _present(out, cols)
+    x = _complete_features(frame, cols)
+    masks = {c: frame[c].isna().to_numpy() for c in cols}
+    for _ in range(iterations):
+        for col in cols:
+            missing = masks[col]
+            if not missing.any() or missing.all():
+                continue
+            others = out[[c for c in cols if c != col]].to_numpy(dtype=float)
+            design = np.column_stack([np.ones(len(out)), x, others])
+            target = np.array(out[col], dtype=float)
+            beta, *_ = np.linalg.lstsq(design[~missing], target[~missing], rcond=None)
+            target[missing] = design[missing] @ beta
+            out[col] = target
+    return out
+
+
+STRATEGIES = {
+    'Mean': _fill_stat('mean'),
+    'Median': _fill_stat('median'),
+    'Group mean by Ctry': _fill_group('Ctry'),
+    'Group mean by Team': _fill_group('Team'),
+    'KNN': knn,
+    'Iterative regression': iterative,
+}
+
+
+def impute(frame, version, strategy='Mean', cols=DEFAULT_COLS):
+    """``frame`` with ``cols`` filled by ``strategy``, cached per dataset version."""
+    return _cache.get_or_compute((version, strategy, tuple(cols)),
+                                 lambda: STRATEGIES[strategy](frame, cols), f'impute:{strategy}')
@@ -0,0 +1,157 @@
+"""Ingest nhl.com skater exports into the season/position-partitioned store.
+
+Usage::
+
+    python ingest.py --kind stats exports/summary_*.xlsx
+    python ingest.py --kind bio --season 20232024 exports/bios_2023.csv
+
+Files are streamed in chunks (``--chunk-size`` rows), so memory stays flat
+however large an export is. Each chunk is validated against the required
+columns for its kind, column names are normalised to the short nhl.com
+headers the app uses, types are coerced (``TOI/GP`` "mm:ss" becomes seconds)
+and the rows are written to ``<store>/<kind>/season=<s>/position=<p>/``.
+Re-running on an unchanged file with the same ``--season`` is a no-op; a
+changed file or a different ``--season`` replaces the parts it wrote last
+time.
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+
+import pandas as pd
+
+import data_store
+from schema import DURATION_COLS, toi_seconds
+
+CHUNK_SIZE = 50_000
+KINDS = ['stats', 'bio']
+INGESTED = 'ingested.json'
+
+# Long-form headers (nhl.com API / CSV exports) -> short headers used in the app
+ALIASES = {
+    'Skater': 'Player', 'Player Name': 'Player', 'Name': 'Player',
+    'Teams': 'Team', 'Team Abbrev': 'Team',
+    'Shoots': 'S/C', 'Skater Shoots': 'S/C', 'Shoots/Catches': 'S/C',
+    'Position': 'Pos',
+    'Country': 'Ctry', 'Birth Country': 'Ctry', 'Nationality': 'Ntnlty',
+    'Height': 'Ht', 'Weight': 'Wt',
+    'Draft Year': 'Draft Yr', 'Draft Round': 'Round', 'Draft Overall': 'Overall',
+    'Games Played': 'GP', 'Goals': 'G', 'Assists': 'A', 'Points': 'P',
+    'Plus/Minus': '+/-', 'Penalty Minutes': 'PIM', 'Points Per Game': 'P/GP',
+    'Shots': 'S', 'Shooting %': 'S%', 'Time On Ice Per Game': 'TOI/GP',
+    'Faceoff Win %': 'FOW%',
+}
+REQUIRED = {
+    'stats': ['Player', 'Team', 'Pos', 'GP', 'G', 'A', 'P'],
+    'bio': ['Player', 'Pos', 'Ctry', 'Ht', 'Wt'],
+}
+STRING_COLS = {'Player', 'Team', 'S/C', 'Pos', 'DOB', 'Birth City', 'S/P', 'Ctry', 'Ntnlty', 'HOF'}
+
+
+def normalize(chunk, kind, season=None, source=''):
+    """Rename, validate and type-coerce one chunk of an export."""
+    chunk = chunk.rename(columns=lambda c: ' '.join(str(c).split()))
+    chunk = chunk.rename(columns=ALIASES)
+    if season is not None:
+        chunk['Season'] = season
+    missing = [c for c in REQUIRED[kind] + ['Season'] if c not in chunk.columns]
+    if missing:
+        raise ValueError(f"{source}: missing required {kind} columns {missing} "
+                         f"(pass --season if the export has no Season column)")
+    for col in chunk.columns:
+        if col in STRING_COLS:
+            chunk[col] = chunk[col].where(chunk[col].isna(), chunk[col].astype(str).str.strip())
+        elif col in DURATION_COLS:
+            chunk[col] = toi_seconds(chunk[col])
+        else:
+            chunk[col] = pd.to_numeric(chunk[col], errors='coerce')
+    chunk = chunk.dropna(subset=['Player', 'Season', 'Pos'])
+    chunk['Season'] = chunk['Season'].astype('int64')
+    return chunk
+
+
+def read_chunks(path, chunk_size=CHUNK_SIZE):
+    """Yield DataFrames of at most ``chunk_size`` rows from an XLSX or CSV export."""
+    if path.lower().endswith('.csv'):
+        yield from pd.read_csv(path, chunksize=chunk_size)
+        return
+    from openpyxl import load_workbook
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = [h for h in next(rows)]
+        batch = []
+        for row in rows:
+            if any(v is not None for v in row):
+                batch.append(row)
+            if len(batch) == chunk_size:
+                yield pd.DataFrame(batch, columns=header)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=header)
+    finally:
+        wb.close()
+
+
+def _read_ingested(root):
+    try:
+        with open(os.path.join(root, INGESTED)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def ingest(path, kind, season=None, store_dir=data_store.STORE_DIR, chunk_size=CHUNK_SIZE):
+    """Write ``path`` into the store; returns the number of rows written (0 if unchanged)."""
+    root = os.path.join(store_dir, kind)
+    os.makedirs(root, exist_ok=True)
+    source = os.path.abspath(path)
+    digest = data_store.file_digest(path)
+    ingested = _read_ingested(root)
+    previous = ingested.get(source)
+    if previous and previous['digest'] == digest and previous.get('season') == season:
+        return 0
+
+    written, rows = [], 0
+    for i, chunk in enumerate(read_chunks(path, chunk_size)):
+        chunk = normalize(chunk, kind, season, source=path)
+        for (s, pos), part in chunk.groupby(['Season', 'Pos'], sort=True):
+            rel = os.path.join(f'season={s}', f'position={pos}', f'{digest[:12]}-{i:05d}')
+            data_store.write_table(part.reset_index(drop=True), os.path.join(root, rel))
+            written.append(rel)
+        rows += len(chunk)
+
+    # Only drop the old parts once the new ones are all in place
+    for rel in (previous or {}).get('parts', []):
+        if rel not in written:
+            shutil.rmtree(os.path.join(root, rel), ignore_errors=True)
+            # Drop the position and season directories once they are empty, so
+            # a season that moved no longer shows up in the sidebar
+            for parent in (os.path.dirname(rel), os.path.dirname(os.path.dirname(rel))):
+                try:
+                    os.rmdir(os.path.join(root, parent))
+                except OSError:
+                    pass
+    ingested[source] = {'digest': digest, 'season': season, 'parts': written}
+    data_store._write_json(os.path.join(root, INGESTED), ingested)
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('files', nargs='+', help="XLSX or CSV exports")
+    parser.add_argument('--kind', choices=KINDS, required=True, help="season stats or bio export")
+    parser.add_argument('--season', type=int, help="season for exports without a Season column, e.g. 20242025")
+    parser.add_argument('--store', default=data_store.STORE_DIR, help="store directory")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+    for path in args.files:
+        rows = ingest(path, args.kind, args.season, args.store, args.chunk_size)
+        print(f"{path}: {rows} rows" if rows else f"{path}: unchanged")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
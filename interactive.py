@@ -0,0 +1,141 @@
+"""Plotly figure builders that stay responsive at large row counts.
+
+Plotly's ``Splom`` draws every panel of a scatter matrix with WebGL in the
+browser, so a 20x20 matrix costs one trace rather than 400 server-side
+renders. Past ``SAMPLE_ROWS`` the rows are stratified-sampled first so each
+group keeps its share of the points.
+
+``scatter`` picks a level of detail by row count: the regular SVG
+``px.scatter`` for small frames, ``Scattergl`` past ``WEBGL_ROWS``, and past
+``BIN_ROWS`` a server-side 2D histogram with only a sample of points carrying
+hover data. Values are sent as float32 and categories as one trace per group,
+which keeps the JSON payload small.
+"""
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+import metrics
+
+SAMPLE_ROWS = 5000
+WEBGL_ROWS = 1000
+BIN_ROWS = 100_000
+BINS = 200
+HOVER_SAMPLE = 2000
+MISSING_LABEL = 'Missing'
+
+
+def _labels(values):
+    # String labels per row; missing values get their own label rather than
+    # staying NaN, which groupby drops and factorize codes as -1
+    return values.astype(str).where(values.notna(), MISSING_LABEL)
+
+
+def stratified_sample(data, n, by=None, seed=0):
+    """At most ``n`` rows of ``data``, sampled proportionally within each ``by`` group."""
+    if len(data) <= n:
+        return data
+    if by is None or by not in data.columns:
+        return data.sample(n=n, random_state=seed)
+    frac = n / len(data)
+    # Group on factorized codes: missing values get their own code (-1),
+    # where grouping a categorical with NaN directly fails in sample()
+    codes, _ = pd.factorize(data[by])
+    return data.groupby(codes, group_keys=False, sort=True).sample(frac=frac, random_state=seed)
+
+
+@metrics.timed('build:scatter_matrix')
+def scatter_matrix(data, cols, color=None, max_rows=SAMPLE_ROWS):
+    """Lower-triangle WebGL scatter matrix of ``cols``, sampled past ``max_rows``."""
+    sample = stratified_sample(data, max_rows, by=color)
+    marker = dict(size=4, opacity=0.7, line=dict(width=0))
+    if color is not None and color in sample.columns:
+        codes, labels = _labels(sample[color]).factorize()
+        marker.update(color=codes, colorscale='Turbo', showscale=False)
+        text = np.asarray(labels, dtype=object).take(codes)
+    else:
+        marker.update(color='dodgerblue')
+        text = None
+    fig = go.Figure(go.Splom(
+        dimensions=[dict(label=c, values=sample[c]) for c in cols],
+        marker=marker,
+        text=text,
+        diagonal_visible=False,
+        showupperhalf=False,
+    ))
+    size = max(600, 120 * len(cols))
+    fig.update_layout(
+        height=size,
+        title=f"Scatter Matrix ({len(sample):,} of {len(data):,} rows)",
+        dragmode='select', hovermode='closest',
+    )
+    return fig
+
+
+def _compact(values):
+    # float32 halves the payload (Plotly serialises typed arrays) and is far
+    # more precision than a screen pixel needs
+    return np.asarray(values, dtype=np.float32)
+
+
+def _gl_traces(data, x, y, color, hover, name_prefix=''):
+    hover = [c for c in hover if c not in (x, y)]
+    template = (f"{x}=%{{x}}<br>{y}=%{{y}}"
+                + ''.join(f"<br>{c}=%{{customdata[{i}]}}" for i, c in enumerate(hover))
+                + "<extra>%{fullData.name}</extra>")
+    if color is None:
+        groups = [('', data)]
+    else:
+        # One trace per category: the label travels once in the legend
+        # instead of once per point
+        groups = data.groupby(_labels(data[color]), sort=True)
+    traces = []
+    for name, group in groups:
+        traces.append(go.Scattergl(
+            x=_compact(group[x]), y=_compact(group[y]),
+            mode='markers', name=f"{name_prefix}{name}" or y,
+            marker=dict(size=5, opacity=0.7),
+            customdata=group[hover].to_numpy() if hover else None,
+            hovertemplate=template,
+            showlegend=color is not None,
+        ))
+    return traces
+
+
+@metrics.timed('build:scatter')
+def scatter(data, x, y, color=None, hover=(), title=None):
+    """Scatter of ``y`` against ``x`` with a level of detail chosen from the row count."""
+    title = title or f"{y} vs {x}"
+    n = len(data)
+    if n <= WEBGL_ROWS:
+        return px.scatter(data, x=x, y=y, color=color, title=title, hover_data=list(hover))
+    if n <= BIN_ROWS:
+        fig = go.Figure(_gl_traces(data, x, y, color, hover))
+    else:
+        xy = data[[x, y]].dropna()
+        counts, xe, ye = np.histogram2d(xy[x], xy[y], bins=BINS)
+        fig = go.Figure(go.Heatmap(
+            x=_compact((xe[:-1] + xe[1:]) / 2), y=_compact((ye[:-1] + ye[1:]) / 2),
+            z=np.log1p(counts.T).astype(np.float32),
+            customdata=counts.T.astype(np.int32),
+            colorscale='Blues', showscale=False,
+            hovertemplate=f"{x}=%{{x}}<br>{y}=%{{y}}<br>players=%{{customdata}}<extra></extra>",
+        ))
+        # Only a sample of points carries hover metadata
+        sample = stratified_sample(data, HOVER_SAMPLE, by=color)
+        fig.add_traces(_gl_traces(sample, x, y, color, hover))
+        title = f"{title} ({n:,} rows binned, {len(sample):,} sampled for hover)"
+    fig.update_layout(title=title, xaxis_title=x, yaxis_title=y)
+    return fig
+
+
+def highlight(fig, points, x, y, name, label=None, symbol='circle-open', size=12):
+    """Overlay ``points`` on a figure from ``scatter`` as one marked, labelled trace."""
+    text = points[label].astype(str).to_numpy() if label in points.columns else None
+    fig.add_trace(go.Scatter(
+        x=_compact(points[x]), y=_compact(points[y]), mode='markers', name=name, text=text,
+        marker=dict(symbol=symbol, size=size, line=dict(width=2)),
+        hovertemplate=f"%{{text}}<br>{x}=%{{x}}<br>{y}=%{{y}}<extra>{name}</extra>",
+    ))
+    return fig
@@ -0,0 +1,123 @@
+"""League dimension table: team -> division -> conference, by season.
+
+Each entry is valid for an inclusive range of seasons (written the way
+nhl.com does, e.g. 20242025), which covers realignment and relocations such
+as Arizona -> Utah. Lookups run once per distinct (team, season) pair and are
+then broadcast back to the rows with ``np.take``, so enriching a frame is a
+single vectorised pass and the results are stored as compact categoricals.
+"""
+import numpy as np
+import pandas as pd
+
+CURRENT_SEASON = 20242025
+FIRST_SEASON = 20132014  # four-division format
+LAST_SEASON = 99999999
+
+DIVISIONS = ['MET', 'ATL', 'CEN', 'PAC']
+CONFERENCES = ['EC', 'WC']
+DIV_CONF = {'MET': 'EC', 'ATL': 'EC', 'CEN': 'WC', 'PAC': 'WC'}
+UNKNOWN = 'Unknown'
+
+# (team, division, first season, last season)
+TEAMS = pd.DataFrame([
+    ('BOS', 'ATL', FIRST_SEASON, LAST_SEASON),
+    ('BUF', 'ATL', FIRST_SEASON, LAST_SEASON),
+    ('DET', 'ATL', FIRST_SEASON, LAST_SEASON),
+    ('FLA', 'ATL', FIRST_SEASON, LAST_SEASON),
+    ('MTL', 'ATL', FIRST_SEASON, LAST_SEASON),
+    ('OTT', 'ATL', FIRST_SEASON, LAST_SEASON),
+    ('TBL', 'ATL', FIRST_SEASON, LAST_SEASON),
+    ('TOR', 'ATL', FIRST_SEASON, LAST_SEASON),
+    ('CAR', 'MET', FIRST_SEASON, LAST_SEASON),
+    ('CBJ', 'MET', FIRST_SEASON, LAST_SEASON),
+    ('NJD', 'MET', FIRST_SEASON, LAST_SEASON),
+    ('NYI', 'MET', FIRST_SEASON, LAST_SEASON),
+    ('NYR', 'MET', FIRST_SEASON, LAST_SEASON),
+    ('PHI', 'MET', FIRST_SEASON, LAST_SEASON),
+    ('PIT', 'MET', FIRST_SEASON, LAST_SEASON),
+    ('WSH', 'MET', FIRST_SEASON, LAST_SEASON),
+    ('CHI', 'CEN', FIRST_SEASON, LAST_SEASON),
+    ('COL', 'CEN', FIRST_SEASON, LAST_SEASON),
+    ('DAL', 'CEN', FIRST_SEASON, LAST_SEASON),
+    ('MIN', 'CEN', FIRST_SEASON, LAST_SEASON),
+    ('NSH', 'CEN', FIRST_SEASON, LAST_SEASON),
+    ('STL', 'CEN', FIRST_SEASON, LAST_SEASON),
+    ('WPG', 'CEN', FIRST_SEASON, LAST_SEASON),
+    ('ARI', 'PAC', FIRST_SEASON, 20202021),
+    ('ARI', 'CEN', 20212022, 20232024),
+    ('UTA', 'CEN', 20242025, LAST_SEASON),
+    ('ANA', 'PAC', FIRST_SEASON, LAST_SEASON),
+    ('CGY', 'PAC', FIRST_SEASON, LAST_SEASON),
+    ('EDM', 'PAC', FIRST_SEASON, LAST_SEASON),
+    ('LAK', 'PAC', FIRST_SEASON, LAST_SEASON),
+    ('SJS', 'PAC', FIRST_SEASON, LAST_SEASON),
+    ('VAN', 'PAC', FIRST_SEASON, LAST_SEASON),
+    ('VGK', 'PAC', 20172018, LAST_SEASON),
+    ('SEA', 'PAC', 20212022, LAST_SEASON),
+], columns=['Team', 'Div', 'From', 'To'])
+
+DIV_DTYPE = pd.CategoricalDtype(DIVISIONS + [UNKNOWN])
+CONF_DTYPE = pd.CategoricalDtype(CONFERENCES + [UNKNOWN])
+
+# Numeric encodings shown on the Dataset Overview page
+SC_CODES = {'L': 0, 'R': 1}
+DIV_CODES = {'MET': 1, 'ATL': 2, 'CEN': 3, 'PAC': 4}
+CONF_CODES = {'EC': 0, 'WC': 1}
+
+
+def final_team(team):
+    """Team a player finished the season with, from strings such as 'TOR, BOS'."""
+    return str(team).split(',')[-1].strip()
+
+
+def division(team, season=CURRENT_SEASON):
+    """Division of ``team`` in ``season``, or 'Unknown'."""
+    t = TEAMS[(TEAMS['Team'] == final_team(team)) & (TEAMS['From'] <= season) & (TEAMS['To'] >= season)]
+    return t['Div'].iat[0] if len(t) else UNKNOWN
+
+
+def enrich(frame):
+    """Return ``(Div, Conf)`` categorical Series for ``frame['Team']``.
+
+    Uses ``frame['Season']`` when present, otherwise ``CURRENT_SEASON``.
+    """
+    teams = pd.Categorical(frame['Team'])
+    if 'Season' in frame.columns:
+        season = pd.to_numeric(frame['Season'], errors='coerce').fillna(CURRENT_SEASON).to_numpy(np.int64)
+    else:
+        season = np.full(len(frame), CURRENT_SEASON, dtype=np.int64)
+    # One label per distinct (team, season); the dimension lookup only runs
+    # for those, and the answers are gathered back to rows by integer code
+    labels, uniques = pd.factorize(teams.codes.astype(np.int64) * 100_000_000 + season)
+    team_names = np.append(np.asarray(teams.categories, dtype=object), UNKNOWN)
+    divs = [division(team_names[u // 100_000_000], u % 100_000_000) for u in uniques]
+    div_codes = np.take(DIV_DTYPE.categories.get_indexer(divs), labels)
+    conf_lookup = CONF_DTYPE.categories.get_indexer(
+        [DIV_CONF.get(d, UNKNOWN) for d in DIV_DTYPE.categories])
+    conf_codes = np.take(conf_lookup, div_codes)
+    div = pd.Categorical.from_codes(div_codes, dtype=DIV_DTYPE).remove_unused_categories()
+    conf = pd.Categorical.from_codes(conf_codes, dtype=CONF_DTYPE).remove_unused_categories()
+    return pd.Series(div, index=frame.index), pd.Series(conf, index=frame.index)
+
+
+def _encode(s, codes):
+    # Map through the categories rather than every row
+    cat = pd.Categorical(s)
+    lookup = np.array([codes.get(c, np.nan) for c in cat.categories] + [np.nan], dtype=float)
+    # Nullable integers: whole numbers in the table, <NA> for unmapped labels
+    return pd.Series(np.take(lookup, cat.codes), index=s.index).astype('Int8')
+
+
+def encode(frame):
+    """Copy of ``frame`` with ``S/C`` coded 0/1 and ``Div_En``/``Conf_En`` added."""
+    view = frame.copy()
+    if 'S/C' in view.columns:
+        sc = _encode(view['S/C'], SC_CODES)
+        unmapped = sc.isna() & view['S/C'].notna()
+        # Labels other than L/R are kept as they are, as the plain map did
+        view['S/C'] = sc.astype(object).where(~unmapped, view['S/C'].astype(object)) if unmapped.any() else sc
+    if 'Div' in view.columns:
+        view['Div_En'] = _encode(view['Div'], DIV_CODES)
+    if 'Conf' in view.columns:
+        view['Conf_En'] = _encode(view['Conf'], CONF_CODES)
+    return view
@@ -0,0 +1,62 @@
+"""Thread-safe LRU cache shared by the compute modules.
+
+Bounded by entry count, total size, or both, and every lookup is counted
+as a hit or miss under the cache's name in ``metrics``. Cached values are
+handed out as-is and must be treated as read-only.
+"""
+import threading
+from collections import OrderedDict
+
+import metrics
+
+
+class LRUCache:
+    def __init__(self, name, max_entries=None, max_bytes=None, sizeof=len):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._data = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """The value under ``key`` (marking it most recently used), else ``default``."""
+        with self._lock:
+            hit = key in self._data
+            if hit:
+                self._data.move_to_end(key)
+                value = self._data[key]
+        metrics.cache(self.name, hit=hit)
+        return value if hit else default
+
+    def put(self, key, value):
+        with self._lock:
+            if key in self._data:
+                self._size -= self._entry_size(self._data[key])
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._size += self._entry_size(value)
+            # Always keep the newest entry, even if it alone is over max_bytes
+            while len(self._data) > 1 and (
+                    (self.max_entries is not None and len(self._data) > self.max_entries)
+                    or (self.max_bytes is not None and self._size > self.max_bytes)):
+                self._size -= self._entry_size(self._data.popitem(last=False)[1])
+        return value
+
+    def get_or_compute(self, key, compute, stage):
+        """Cached value for ``key``, or ``compute()`` timed as ``stage`` and stored."""
+        value = self.get(key)
+        if value is not None:
+            return value
+        with metrics.timer(stage):
+            value = compute()
+        return self.put(key, value)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+
+    def _entry_size(self, value):
+        return self._sizeof(value) if self.max_bytes is not None else 0
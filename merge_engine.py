@@ -0,0 +1,162 @@
+"""Key-based, incremental join of the season stats and bio stats exports.
+
+Rows are matched on player identity rather than position: a normalised
+player name plus handedness and position (and the season when both exports
+carry one). Birth date and draft details only exist in the bio export, so
+they can't take part in the key.
+The joined table is stored in the columnar cache together with a per-row
+hash of each side, so a refresh only re-joins players whose season row or
+bio row actually changed and copies every other row from the stored version.
+"""
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+import data_store
+
+KEY = '_key'
+SEASON_HASH = '_season_hash'
+BIO_HASH = '_bio_hash'
+INTERNAL_COLS = [KEY, SEASON_HASH, BIO_HASH]
+STORE_DIR = os.path.join(data_store.CACHE_DIR, 'merged')
+STATE = 'state.json'
+KEEP_VERSIONS = 2
+
+
+def player_key(frame, extra=()):
+    """Normalised identity key: accent-folded lower-case name, shooting side, extras."""
+    key = (frame['Player'].astype(str)
+           .str.normalize('NFKD')
+           .str.encode('ascii', 'ignore').str.decode('ascii')
+           .str.lower()
+           .str.replace(r'[^a-z0-9]', '', regex=True))
+    for col in ('S/C',) + tuple(extra):
+        if col in frame.columns:
+            key = key + '|' + frame[col].fillna('').astype(str)
+    return key
+
+
+def _row_hash(frame):
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+
+def _prepare(season, bio, bio_cols):
+    # Position and season are only part of the key when both exports carry them
+    extra = tuple(c for c in ('Pos', 'Season') if c in season.columns and c in bio.columns)
+    season = season.copy()
+    season[KEY] = player_key(season, extra).to_numpy()
+    season[SEASON_HASH] = _row_hash(season.drop(columns=[KEY]))
+
+    right = bio[bio_cols].copy()
+    right[KEY] = player_key(bio, extra).to_numpy()
+    # A row repeated verbatim is harmless, but two different bio rows for one
+    # key would hand one player's size and draft details to the other
+    right = right.drop_duplicates()
+    clash = right[KEY].duplicated(keep=False)
+    if clash.any():
+        names = sorted(bio.loc[clash.index[clash], 'Player'].astype(str).unique())
+        raise ValueError(f"Bio export has conflicting rows for {len(names)} players: "
+                         + ', '.join(names[:10]) + (', ...' if len(names) > 10 else ''))
+    right[BIO_HASH] = _row_hash(right.drop(columns=[KEY]))
+    return season, right
+
+
+def _bio_hashes(right, keys):
+    # The matching bio row's hash per key, 0 where there is none (including
+    # every key when the bio export is empty)
+    pos = pd.Index(right[KEY]).get_indexer(keys)
+    hashes = right[BIO_HASH].to_numpy()
+    if not len(hashes):
+        return np.zeros(len(pos), dtype=np.uint64)
+    return np.where(pos >= 0, hashes[np.maximum(pos, 0)], np.uint64(0))
+
+
+def _join(season, right):
+    merged = season.merge(right.drop(columns=[BIO_HASH]), on=KEY, how='left',
+                          validate='many_to_one')
+    # Carry the bio hash separately so unmatched rows get 0 instead of a NaN
+    # that would force the uint64 hashes through float
+    merged[BIO_HASH] = _bio_hashes(right, merged[KEY])
+    return merged
+
+
+def _row_ids(keys):
+    # Traded players can appear more than once per season; number repeats so
+    # every row has a unique id for the index lookups
+    keys = pd.Series(np.asarray(keys, dtype=object))
+    return keys + '#' + keys.groupby(keys).cumcount().astype(str)
+
+
+def _read_state(store_dir):
+    try:
+        with open(os.path.join(store_dir, STATE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _version_number(name):
+    number, _, _ = name[1:].partition('-')
+    return int(number) if name.startswith('v') and number.isdigit() else None
+
+
+def _write_version(merged, source_version, store_dir, state):
+    number = state['number'] + 1 if state else 1
+    # Concurrent builds can read the same state and pick the same number; a
+    # random suffix keeps their tables apart, so the state written below
+    # always names the table that holds this source_version
+    name = f'v{number}-{os.urandom(4).hex()}'
+    data_store.write_table(merged, os.path.join(store_dir, name))
+    data_store._write_json(os.path.join(store_dir, STATE),
+                           {'number': number, 'table': name, 'source_version': source_version})
+    # Drop versions older than the last few; readers of the old state still
+    # find their table because the current one is always kept
+    for entry in os.listdir(store_dir):
+        old = _version_number(entry)
+        if old is not None and old <= number - KEEP_VERSIONS:
+            shutil.rmtree(os.path.join(store_dir, entry), ignore_errors=True)
+
+
+def _read_version(store_dir, state):
+    # None when there is no state or its table has already been pruned
+    try:
+        return data_store.read_table(os.path.join(store_dir, state['table'])) if state else None
+    except OSError:
+        return None
+
+
+def merge_players(season, bio, bio_cols, source_version=None, store_dir=STORE_DIR):
+    """Left-join ``bio[bio_cols]`` onto ``season`` by player key, reusing the stored version.
+
+    Returns the joined frame in season-export order, including the internal
+    key and row-hash columns listed in ``INTERNAL_COLS``.
+    """
+    state = _read_state(store_dir)
+    prev = _read_version(store_dir, state)
+    if prev is not None and source_version and state['source_version'] == source_version:
+        return prev
+
+    season, right = _prepare(season, bio, bio_cols)
+    if prev is None or set(prev.columns) != set(season.columns) | set(right.columns):
+        merged = _join(season, right)
+    else:
+        # Hash-index lookups: where each current row sat in the stored table,
+        # and the hash of the bio row (if any) it matches now
+        pos = pd.Index(_row_ids(prev[KEY])).get_indexer(_row_ids(season[KEY]))
+        bio_hash = _bio_hashes(right, season[KEY])
+        unchanged = ((pos >= 0)
+                     & (np.asarray(prev[SEASON_HASH])[pos] == season[SEASON_HASH].to_numpy())
+                     & (np.asarray(prev[BIO_HASH])[pos] == bio_hash))
+        fresh = _join(season[~unchanged], right)
+        kept = prev.iloc[pos[unchanged]]
+        merged = pd.concat([kept, fresh], ignore_index=True)
+        # Restore season-export order
+        source_rows = np.concatenate([np.flatnonzero(unchanged), np.flatnonzero(~unchanged)])
+        merged = merged.iloc[np.argsort(source_rows, kind='stable')].reset_index(drop=True)
+        merged = merged[list(season.columns) + [c for c in right.columns if c != KEY]]
+
+    _write_version(merged, source_version, store_dir, state)
+    return merged
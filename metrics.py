@@ -0,0 +1,171 @@
+"""Hot-path instrumentation: stage timers, cache hit/miss counters, chart payloads.
+
+Totals are process-wide and can be read as Prometheus text
+(``prometheus_text``, or over HTTP with ``serve``); every event is also
+logged as one JSON line on the ``nhl_app.perf`` logger. Events are
+additionally collected per thread between ``begin_rerun`` calls, which gives
+the sidebar Performance panel a breakdown of the current rerun (Streamlit
+runs each session's script in its own thread).
+"""
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+log = logging.getLogger('nhl_app.perf')
+
+_lock = threading.Lock()
+_stage_seconds = defaultdict(float)
+_stage_calls = defaultdict(int)
+_stage_max = defaultdict(float)
+_cache_hits = defaultdict(int)
+_cache_misses = defaultdict(int)
+_payload_bytes = {}
+_payload_total = defaultdict(int)
+_local = threading.local()
+
+
+def _event(kind, **fields):
+    events = getattr(_local, 'events', None)
+    if events is not None:
+        events.append(dict(kind=kind, **fields))
+    if log.isEnabledFor(logging.INFO):
+        log.info(json.dumps(dict(kind=kind, ts=time.time(), **fields)))
+
+
+def begin_rerun():
+    """Start collecting this thread's events for the Performance panel."""
+    _local.events = []
+
+
+def rerun_events():
+    return list(getattr(_local, 'events', None) or [])
+
+
+@contextmanager
+def timer(stage):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        with _lock:
+            _stage_seconds[stage] += seconds
+            _stage_calls[stage] += 1
+            _stage_max[stage] = max(_stage_max[stage], seconds)
+        _event('stage', stage=stage, seconds=round(seconds, 6))
+
+
+def timed(stage):
+    """Decorator form of ``timer``."""
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with timer(stage):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def cache(name, hit):
+    """Count a hit or miss on the cache called ``name``."""
+    with _lock:
+        (_cache_hits if hit else _cache_misses)[name] += 1
+    _event('cache', cache=name, hit=hit)
+
+
+def miss(name):
+    """Called from inside a Streamlit-cached function body, which only runs on a miss."""
+    if not hasattr(_local, 'missed'):
+        _local.missed = set()
+    _local.missed.add(name)
+
+
+@contextmanager
+def cached_call(name):
+    """Time a call to a Streamlit-cached function and count it as a hit unless it called ``miss``."""
+    if not hasattr(_local, 'missed'):
+        _local.missed = set()
+    _local.missed.discard(name)
+    with timer(name):
+        yield
+    cache(name, hit=name not in _local.missed)
+    _local.missed.discard(name)
+
+
+def payload(chart, nbytes):
+    """Record the serialised size of a chart sent to the browser."""
+    with _lock:
+        _payload_bytes[chart] = nbytes
+        _payload_total[chart] += nbytes
+    _event('payload', chart=chart, bytes=nbytes)
+
+
+def snapshot():
+    with _lock:
+        return {
+            'stages': {s: {'calls': _stage_calls[s], 'seconds': _stage_seconds[s], 'max': _stage_max[s]}
+                       for s in _stage_calls},
+            'caches': {c: {'hits': _cache_hits[c], 'misses': _cache_misses[c]}
+                       for c in set(_cache_hits) | set(_cache_misses)},
+            'payloads': {c: {'last': _payload_bytes[c], 'total': _payload_total[c]} for c in _payload_bytes},
+        }
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"')
+
+
+def prometheus_text():
+    """All totals in the Prometheus text exposition format."""
+    snap = snapshot()
+    lines = []
+
+    def family(name, kind, help_text, samples):
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+        lines.extend(f'{name}{{{label}="{_label(key)}"}} {value}' for label, key, value in samples)
+
+    stages = sorted(snap['stages'].items())
+    family('nhl_stage_seconds_total', 'counter', 'Time spent per stage.',
+           [('stage', s, v['seconds']) for s, v in stages])
+    family('nhl_stage_calls_total', 'counter', 'Calls per stage.',
+           [('stage', s, v['calls']) for s, v in stages])
+    family('nhl_stage_seconds_max', 'gauge', 'Slowest call per stage.',
+           [('stage', s, v['max']) for s, v in stages])
+    caches = sorted(snap['caches'].items())
+    family('nhl_cache_hits_total', 'counter', 'Cache hits.', [('cache', c, v['hits']) for c, v in caches])
+    family('nhl_cache_misses_total', 'counter', 'Cache misses.', [('cache', c, v['misses']) for c, v in caches])
+    payloads = sorted(snap['payloads'].items())
+    family('nhl_chart_payload_bytes', 'gauge', 'Size of the last payload per chart.',
+           [('chart', c, v['last']) for c, v in payloads])
+    family('nhl_chart_payload_bytes_total', 'counter', 'Bytes sent per chart.',
+           [('chart', c, v['total']) for c, v in payloads])
+    return '\n'.join(lines) + '\n'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.rstrip('/') != '/metrics':
+            self.send_error(404)
+            return
+        body = prometheus_text().encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(port, host='0.0.0.0'):
+    """Serve ``/metrics`` on ``port`` from a daemon thread; returns the server."""
+    server = ThreadingHTTPServer((host, port), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True, name='metrics').start()
+    return server
@@ -0,0 +1,180 @@
+"""Linear models for predicting points (``P``) from the merged dataset.
+
+OLS, ridge and lasso are all fitted from sufficient statistics (row count,
+column sums, ``X'X`` and ``X'y``), so a fit is a small p x p solve however
+many rows there are. k-fold cross-validation reuses the full-data statistics:
+each fold's training set is "all rows minus that fold", and the folds are
+solved in parallel. Fits and CV scores are cached by (dataset version,
+feature set, target, model, alpha).
+
+``fit`` and ``predict`` have no Streamlit dependency and can be used for
+batch predictions from scripts.
+"""
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from lru import LRUCache
+
+MODELS = ['OLS', 'Ridge', 'Lasso']
+DEFAULT_FEATURES = ['A', 'EVP']
+TARGET = 'P'
+DEFAULT_ALPHA = 0.1
+DEFAULT_FOLDS = 5
+MAX_ENTRIES = 64
+LASSO_ITERS = 1000
+LASSO_TOL = 1e-8
+
+_cache = LRUCache('modeling', max_entries=MAX_ENTRIES)
+
+
+def _cached(key, compute):
+    return _cache.get_or_compute(key, compute, f'modeling:{key[0]}')
+
+
+def complete_rows(frame, features, target=TARGET):
+    """Number of rows with every feature and the target present, i.e. the rows a fit uses."""
+    return int(frame[list(features) + [target]].notna().all(axis=1).sum())
+
+
+def min_rows(n_features, k=None):
+    """Fewest complete rows ``fit`` (or ``cross_validate`` with ``k`` folds) needs."""
+    need = n_features + 1
+    if k is None:
+        return need
+    # Every fold needs two held-out rows for its R^2, and the rows left to
+    # train on must still outnumber the features
+    need = max(need, 2 * k)
+    while need - math.ceil(need / k) < n_features + 1:
+        need += 1
+    return need
+
+
+def _check_rows(n, n_features, k=None):
+    need = min_rows(n_features, k)
+    if n < need:
+        raise ValueError(f"Only {n} rows have every feature and the target; at least {need} are needed"
+                         + (f" for {k}-fold cross-validation" if k is not None else ""))
+
+
+def _xy(frame, features, target):
+    rows = frame[list(features) + [target]].dropna()
+    return rows[list(features)].to_numpy(dtype=float), rows[target].to_numpy(dtype=float)
+
+
+def _stats(x, y):
+    return np.array(len(y), dtype=float), x.sum(axis=0), y.sum(), x.T @ x, x.T @ y
+
+
+def _lasso(gram, c, n, alpha):
+    # Coordinate descent on (1/2n)||y - Xb||^2 + alpha*||b||_1, using only the
+    # Gram matrix so each sweep is O(p^2) regardless of the row count
+    b = np.zeros(len(c))
+    diag = np.diag(gram)
+    for _ in range(LASSO_ITERS):
+        biggest = 0.0
+        for j in range(len(c)):
+            if diag[j] == 0:
+                continue
+            rho = c[j] - gram[j] @ b + diag[j] * b[j]
+            new = np.sign(rho) * max(abs(rho) - n * alpha, 0.0) / diag[j]
+            biggest = max(biggest, abs(new - b[j]))
+            b[j] = new
+        if biggest < LASSO_TOL:
+            break
+    return b
+
+
+def _solve(stats, kind, alpha):
+    n, sx, sy, xx, xy = stats
+    mx, my = sx / n, sy / n
+    gram = xx - n * np.outer(mx, mx)
+    c = xy - n * mx * my
+    # Penalties apply on the standardised scale so alpha means the same thing
+    # for every feature
+    scale = np.sqrt(np.clip(np.diag(gram), 0, None) / n)
+    scale[scale == 0] = 1.0
+    gram_s = gram / np.outer(scale, scale)
+    c_s = c / scale
+    if kind == 'OLS':
+        b = np.linalg.lstsq(gram_s, c_s, rcond=None)[0]
+    elif kind == 'Ridge':
+        b = np.linalg.solve(gram_s + n * alpha * np.eye(len(c_s)), c_s)
+    elif kind == 'Lasso':
+        b = _lasso(gram_s, c_s, n, alpha)
+    else:
+        raise ValueError(f"Unknown model: {kind}")
+    coef = b / scale
+    return my - mx @ coef, coef
+
+
+def fit(frame, features, target=TARGET, kind='OLS', alpha=DEFAULT_ALPHA, version=None):
+    """Fit ``kind`` on the complete rows of ``frame``; cached when ``version`` is given.
+
+    Raises ``ValueError`` when there are fewer complete rows than ``min_rows``.
+    """
+    features = tuple(features)
+
+    def compute():
+        x, y = _xy(frame, features, target)
+        _check_rows(len(y), len(features))
+        intercept, coef = _solve(_stats(x, y), kind, alpha)
+        return {'kind': kind, 'alpha': alpha, 'features': list(features), 'target': target,
+                'intercept': float(intercept), 'coef': coef, 'rows': len(y)}
+
+    if version is None:
+        return compute()
+    return _cached(('fit', version, features, target, kind, alpha), compute)
+
+
+def predict(model, frame):
+    """Predicted target for every row of ``frame`` (NaN where a feature is missing)."""
+    x = frame[model['features']].to_numpy(dtype=float)
+    return model['intercept'] + x @ model['coef']
+
+
+def coefficients(model):
+    return pd.DataFrame({'Feature': ['(intercept)'] + model['features'],
+                         'Coefficient': np.r_[model['intercept'], model['coef']]})
+
+
+def cross_validate(frame, features, target=TARGET, kind='OLS', alpha=DEFAULT_ALPHA, k=DEFAULT_FOLDS, seed=0,
+                   version=None):
+    """k-fold R^2 and RMSE per fold, plus out-of-fold predictions for the complete rows.
+
+    Raises ``ValueError`` when there are fewer complete rows than ``min_rows``.
+    """
+    features = tuple(features)
+
+    def compute():
+        x, y = _xy(frame, features, target)
+        _check_rows(len(y), len(features), k)
+        folds = np.random.default_rng(seed).permutation(len(y)) % k
+        total = _stats(x, y)
+
+        def run(f):
+            test = folds == f
+            held = _stats(x[test], y[test])
+            train = tuple(t - h for t, h in zip(total, held))
+            intercept, coef = _solve(train, kind, alpha)
+            pred = intercept + x[test] @ coef
+            resid = y[test] - pred
+            ss_tot = ((y[test] - y[test].mean()) ** 2).sum()
+            return f, pred, {'Fold': f + 1,
+                             'R2': 1 - (resid @ resid) / ss_tot if ss_tot else np.nan,
+                             'RMSE': float(np.sqrt(np.mean(resid ** 2)))}
+
+        oof = np.empty(len(y))
+        scores = []
+        with ThreadPoolExecutor(max_workers=min(k, os.cpu_count() or 1)) as pool:
+            for f, pred, score in pool.map(run, range(k)):
+                oof[folds == f] = pred
+                scores.append(score)
+        return {'scores': pd.DataFrame(scores), 'actual': y, 'predicted': oof}
+
+    if version is None:
+        return compute()
+    return _cached(('cv', version, features, target, kind, alpha, k, seed), compute)
@@ -0,0 +1,50 @@
+"""Streamlit-free compute paths behind the app's pages.
+
+``streamlit_app.py`` wraps these in its caches; ``benchmark.py`` calls them
+directly so each page's work can be timed headlessly.
+"""
+import pandas as pd
+
+import league
+import merge_engine
+import metrics
+import schema
+
+BIO_COLS = ['Ctry', 'Ht', 'Wt', 'Draft Yr', 'Round', 'Overall']
+
+
+@metrics.timed('build_dataset')
+def build_dataset(hockey, bio, version, store_dir=merge_engine.STORE_DIR):
+    """Merged, enriched and compacted dataset from the season and bio exports."""
+    if bio.empty:
+        bio = pd.DataFrame(columns=['Player', 'S/C'] + BIO_COLS)
+    # Join on player identity (not row position) so the two exports can be
+    # sorted differently or differ in length; unchanged players are reused
+    # from the last stored merge
+    merged = merge_engine.merge_players(hockey, bio, BIO_COLS, source_version=version, store_dir=store_dir)
+    # Season and Pos are only dropped when the data covers a single one
+    drop = ['S%'] + [col for col in ['Pos', 'Season'] if col in merged.columns and merged[col].nunique() <= 1]
+    data = merged.drop(columns=drop + merge_engine.INTERNAL_COLS, errors='ignore')
+
+    # Add Div and Conf columns from the league dimension table (enriched
+    # before Season is dropped, so relocations resolve per season)
+    if 'Team' in data.columns:
+        data['Div'], data['Conf'] = league.enrich(merged)
+    else:
+        data['Div'] = 'Unknown'
+        data['Conf'] = 'Unknown'
+    return schema.compact(data)
+
+
+@metrics.timed('overview_compute')
+def overview(data):
+    """Everything the Dataset Overview page derives from the dataset."""
+    return {
+        'rows': data.shape[0],
+        'features': data.shape[1],
+        'missing': int(data.isnull().sum().sum()),
+        'view': league.encode(data),
+        'dtypes': schema.memory_profile(data),
+        'memory_kb': data.memory_usage(deep=True).sum() / 1024,
+        'summary': data.describe().T,
+    }
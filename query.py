@@ -0,0 +1,78 @@
+"""Group counts and aggregates over categorical codes for the Class Imbalance page.
+
+Each categorical column is factorised once per dataset version into integer
+codes. Filters become ``np.isin`` masks over those codes, and counts and
+means come from ``np.bincount`` (with the metric as weights), so a
+summary is a few linear passes over small integer arrays rather than a
+``value_counts`` over object strings. Summaries are cached per
+(version, group-by column, filters).
+"""
+import numpy as np
+import pandas as pd
+
+from lru import LRUCache
+
+GROUP_COLS = ['S/C', 'Ctry', 'Div', 'Conf', 'Team', 'Season', 'Pos']
+METRICS = ['P', 'P/GP']
+MAX_ENTRIES = 256
+
+_tables = LRUCache('query_codes', max_entries=4)
+_summaries = LRUCache('query', max_entries=MAX_ENTRIES)
+
+
+def codes_table(frame, version):
+    """``{column: (codes, labels)}`` for the groupable columns, plus the metric arrays."""
+    table = _tables.get(version)
+    if table is not None:
+        return table
+    table = {'columns': {}, 'metrics': {}}
+    for col in GROUP_COLS:
+        if col in frame.columns:
+            codes, labels = pd.factorize(frame[col], sort=True)
+            table['columns'][col] = (codes.astype(np.int32), np.asarray(labels, dtype=object))
+    for col in METRICS:
+        if col in frame.columns:
+            table['metrics'][col] = frame[col].to_numpy(dtype=float)
+    return _tables.put(version, table)
+
+
+def mask(table, filters):
+    """Boolean row mask for ``{column: selected labels}``; empty selections don't filter."""
+    n = len(next(iter(table['columns'].values()))[0]) if table['columns'] else 0
+    keep = np.ones(n, dtype=bool)
+    for col, selected in filters.items():
+        if not selected or col not in table['columns']:
+            continue
+        codes, labels = table['columns'][col]
+        wanted = np.flatnonzero(np.isin(labels, list(selected)))
+        keep &= np.isin(codes, wanted)
+    return keep
+
+
+def summary(frame, version, by, filters=None):
+    """Count and mean of each metric per ``by`` category among rows passing ``filters``."""
+    filters = {c: tuple(v) for c, v in (filters or {}).items() if v}
+    key = (version, by, tuple(sorted(filters.items())))
+    result = _summaries.get(key)
+    if result is not None:
+        return result
+    table = codes_table(frame, version)
+    codes, labels = table['columns'][by]
+    keep = mask(table, filters) & (codes >= 0)
+    group = codes[keep]
+    counts = np.bincount(group, minlength=len(labels))
+    out = pd.DataFrame({by: labels, 'Count': counts})
+    for col, values in table['metrics'].items():
+        v = values[keep]
+        present = ~np.isnan(v)
+        sums = np.bincount(group[present], weights=v[present], minlength=len(labels))
+        n = np.bincount(group[present], minlength=len(labels))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out[f'Mean {col}'] = sums / n
+    out = out[out['Count'] > 0].sort_values('Count', ascending=False, kind='stable')
+    return _summaries.put(key, out.reset_index(drop=True))
+
+
+def options(frame, version, col):
+    """Sorted labels of a groupable column."""
+    return list(codes_table(frame, version)['columns'][col][1])
@@ -0,0 +1,62 @@
+"""Column types for the merged dataset.
+
+``compact`` converts the frame produced by ``load_data`` to the smallest
+dtypes that hold it: categoricals for low-cardinality strings, int8/int16
+for complete counting stats, float32 for rates and for counts with missing
+values (so they stay plain NumPy arrays), and ``TOI/GP`` parsed from
+"mm:ss" to seconds.
+"""
+import numpy as np
+import pandas as pd
+
+DURATION_COLS = ['TOI/GP']
+RATE_COLS = ['P/GP', 'S%', 'FOW%']
+# Share of distinct values below which a string column becomes a categorical
+CATEGORY_RATIO = 0.5
+
+
+def toi_seconds(s):
+    """Convert "mm:ss" (or "hh:mm:ss") strings to seconds; numbers pass through."""
+    if pd.api.types.is_numeric_dtype(s):
+        return s.astype(float)
+    parts = s.astype(str).str.strip().str.split(':', expand=True).apply(pd.to_numeric, errors='coerce')
+    seconds = parts[0]
+    for i in range(1, parts.shape[1]):
+        # Rows with fewer fields than the longest one keep their total so far
+        seconds = seconds.where(parts[i].isna(), seconds * 60 + parts[i])
+    return seconds.where(s.notna())
+
+
+def _compact_column(s):
+    name = s.name
+    if name in DURATION_COLS:
+        return toi_seconds(s).astype(np.float32)
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        return s
+    if pd.api.types.is_bool_dtype(s):
+        return s
+    if pd.api.types.is_numeric_dtype(s):
+        if name in RATE_COLS or s.isna().any():
+            return s.astype(np.float32)
+        values = s.to_numpy()
+        if np.issubdtype(values.dtype, np.floating) and not np.array_equal(values, np.round(values)):
+            return s.astype(np.float32)
+        return pd.to_numeric(s.astype(np.int64), downcast='integer')
+    if pd.api.types.is_object_dtype(s) or pd.api.types.is_string_dtype(s):
+        if len(s) and s.nunique(dropna=True) / len(s) < CATEGORY_RATIO:
+            return s.astype('category')
+    return s
+
+
+def compact(frame):
+    """Copy of ``frame`` with every column in its compact dtype."""
+    return pd.DataFrame({col: _compact_column(frame[col]) for col in frame.columns}, index=frame.index)
+
+
+def memory_profile(frame):
+    """Per-column dtype and in-memory size, largest first."""
+    usage = frame.memory_usage(deep=True, index=False)
+    return (pd.DataFrame({'Column': usage.index, 'Type': frame.dtypes.astype(str).to_numpy(),
+                          'Memory (KB)': (usage.to_numpy() / 1024).round(1)})
+              .sort_values('Memory (KB)', ascending=False, kind='stable')
+              .reset_index(drop=True))
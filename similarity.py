@@ -0,0 +1,73 @@
+"""Nearest comparable players on standardised stats.
+
+The feature columns are z-scored in one vectorised pass (missing values sit
+at the column mean, i.e. 0) and loaded into a KD-tree, built once per
+dataset version and cached. A top-k query is then a logarithmic tree
+search instead of a scan over every other player.
+"""
+import numpy as np
+from scipy.spatial import cKDTree
+
+import metrics
+from lru import LRUCache
+
+FEATURES = ['P/GP', 'TOI/GP', 'EVP', 'PPP', 'S', '+/-', 'Ht', 'Wt', 'Overall']
+SHOW_COLS = ['Player', 'Team', 'Season', 'Ctry']
+DEFAULT_K = 5
+MAX_ENTRIES = 4
+
+_cache = LRUCache('similarity', max_entries=MAX_ENTRIES)
+_labels = LRUCache('similarity_labels', max_entries=MAX_ENTRIES)
+
+
+def standardize(frame, features):
+    """``(z, mean, scale)`` for ``features``; NaNs become 0 and constant columns keep scale 1."""
+    x = frame[features].to_numpy(dtype=float)
+    present = ~np.isnan(x)
+    counts = np.maximum(present.sum(axis=0), 1)
+    mean = np.where(present, x, 0.0).sum(axis=0) / counts
+    dev = np.where(present, x - mean, 0.0)
+    scale = np.sqrt((dev * dev).sum(axis=0) / counts)
+    scale[scale == 0] = 1.0
+    return dev / scale, mean, scale
+
+
+def index(frame, version, features=FEATURES):
+    """KD-tree over the standardised ``features`` of ``frame``, cached per dataset version."""
+    features = tuple(c for c in features if c in frame.columns)
+
+    def build():
+        z, mean, scale = standardize(frame, list(features))
+        return {'features': list(features), 'mean': mean, 'scale': scale, 'z': z, 'tree': cKDTree(z)}
+
+    return _cache.get_or_compute((version, features), build, 'similarity:index')
+
+
+def labels(frame, version):
+    """``(labels, order)``: a "Player, Team, Season" label per row and the rows in label order."""
+    def build():
+        text = frame['Player'].astype(str)
+        for col in ['Team', 'Season']:
+            if col in frame.columns:
+                text = text + ', ' + frame[col].astype(str)
+        text = text.to_numpy()
+        return text, np.argsort(text, kind='stable').tolist()
+
+    return _labels.get_or_compute(version, build, 'similarity:labels')
+
+
+def similar(frame, version, row, k=DEFAULT_K, features=FEATURES):
+    """The ``k`` rows of ``frame`` nearest to positional ``row``, closest first, with their distance."""
+    idx = index(frame, version, features)
+    k = min(k, len(frame) - 1)
+    dist, pos = np.empty(0), np.empty(0, dtype=int)
+    if k >= 1:
+        with metrics.timer('similarity:query'):
+            # One extra neighbour because the player matches themself
+            dist, pos = idx['tree'].query(idx['z'][row], k=k + 1)
+        keep = pos != row
+        dist, pos = dist[keep][:k], pos[keep][:k]
+    cols = [c for c in SHOW_COLS if c in frame.columns] + idx['features']
+    out = frame.iloc[pos][cols].copy()
+    out.insert(0, 'Distance', dist.round(3))
+    return out
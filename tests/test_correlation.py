@@ -0,0 +1,36 @@
+"""The matrix-product correlations against ``DataFrame.corr``."""
+import numpy as np
+import pandas as pd
+import pytest
+
+import correlation
+
+
+def _frame(rows=200, seed=0):
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame({
+        'A': rng.integers(0, 10, rows).astype(float),  # heavy ties
+        'B': rng.normal(size=rows),
+        'C': rng.integers(0, 3, rows).astype(float),
+        'D': rng.normal(size=rows),
+        'E': rng.normal(size=rows),
+    })
+    data['B'] += data['A']
+    # Two columns share a missingness pattern, one has its own, A and E are complete
+    holes = rng.random(rows) < 0.2
+    data.loc[holes, ['B', 'C']] = np.nan
+    data.loc[rng.random(rows) < 0.3, 'D'] = np.nan
+    return data
+
+
+@pytest.mark.parametrize('method', ['pearson', 'spearman'])
+def test_compute_matches_pandas(method):
+    data = _frame()
+    pd.testing.assert_frame_equal(correlation.compute(data, method), data.corr(method=method))
+
+
+@pytest.mark.parametrize('method', ['pearson', 'spearman'])
+def test_extend_matches_pandas(method):
+    data = _frame(seed=1)
+    corr = correlation.compute(data[['A', 'B', 'D']], method)
+    pd.testing.assert_frame_equal(correlation.extend(corr, data, method), data.corr(method=method))
@@ -0,0 +1,23 @@
+"""Sampling and level-of-detail paths of the Plotly builders."""
+import numpy as np
+import pandas as pd
+
+import interactive
+
+
+def test_stratified_sample_keeps_missing_group():
+    data = pd.DataFrame({'x': np.arange(1000.0),
+                         'Ctry': pd.Categorical(['CAN', 'USA', None, 'CAN'] * 250)})
+    sample = interactive.stratified_sample(data, 100, by='Ctry')
+    assert len(sample) == 100
+    assert sample['Ctry'].isna().sum() == 25
+    assert (sample['Ctry'] == 'CAN').sum() == 50
+
+
+def test_binned_scatter_with_missing_color():
+    n = interactive.BIN_ROWS + 1
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({'A': rng.random(n), 'P': rng.random(n),
+                         'Ctry': pd.Categorical(np.where(rng.random(n) < 0.1, None, 'CAN'))})
+    fig = interactive.scatter(data, 'A', 'P', color='Ctry')
+    assert len(fig.data) == 3  # the 2D histogram plus one hover trace per country
@@ -0,0 +1,56 @@
+"""Incremental merges must match a fresh full join of the same exports."""
+import os
+
+import pandas as pd
+import pytest
+
+import merge_engine
+import pipeline
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _exports():
+    return pd.read_excel(os.path.join(ROOT, 'SS.xlsx')), pd.read_excel(os.path.join(ROOT, 'Bio.xlsx'))
+
+
+def _merge(season, bio, version, store_dir):
+    merged = merge_engine.merge_players(season, bio, pipeline.BIO_COLS, source_version=version,
+                                        store_dir=str(store_dir))
+    return merged.drop(columns=merge_engine.INTERNAL_COLS)
+
+
+def _assert_same(incremental, fresh):
+    assert list(incremental.columns) == list(fresh.columns)
+    for col in fresh.columns:
+        pd.testing.assert_series_equal(incremental[col], fresh[col], check_dtype=False, check_names=False,
+                                       obj=col)
+
+
+def test_incremental_matches_full_join(tmp_path):
+    season, bio = _exports()
+    _merge(season, bio, 'v1', tmp_path / 'store')
+
+    # Reorder both exports, edit one season row and one bio row, drop a player
+    season = season.sample(frac=1.0, random_state=0).reset_index(drop=True)
+    bio = bio.sample(frac=1.0, random_state=1).reset_index(drop=True)
+    season.loc[0, 'G'] += 1
+    bio.loc[bio['Player'] == season.loc[1, 'Player'], 'Ht'] += 1
+    season = season.drop(index=2).reset_index(drop=True)
+
+    incremental = _merge(season, bio, 'v2', tmp_path / 'store')
+    fresh = _merge(season, bio, 'v2', tmp_path / 'fresh')
+    _assert_same(incremental, fresh)
+    assert incremental.loc[1, 'Ht'] == bio.loc[bio['Player'] == season.loc[1, 'Player'], 'Ht'].iloc[0]
+
+
+def test_conflicting_bio_rows_are_rejected(tmp_path):
+    season, bio = _exports()
+    bio = pd.concat([bio, bio.iloc[[0]].assign(Ht=bio['Ht'].iloc[0] + 1)], ignore_index=True)
+    with pytest.raises(ValueError, match=bio['Player'].iloc[0]):
+        _merge(season, bio, 'v1', tmp_path / 'store')
+
+
+def test_player_key_keeps_digits_and_position():
+    frame = pd.DataFrame({'Player': ['Player 1', 'Player 2', 'Émile Poirier'], 'S/C': 'L', 'Pos': ['D', 'D', 'L']})
+    assert merge_engine.player_key(frame, ('Pos',)).tolist() == ['player1|L|D', 'player2|L|D', 'emilepoirier|L|L']
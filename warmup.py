@@ -0,0 +1,172 @@
+"""Background warm-up of every page artifact for a new dataset version.
+
+A ``Warmer`` watches the source version. When it changes, a background
+thread builds the merged frame and then fills the shared caches with
+everything the pages would otherwise compute on first view: correlations
+for every method, every imputation strategy, the similarity index, the
+Class Imbalance codes, the default model, and all of the heatmap and
+pairplot images. Numeric artifacts are computed in a thread pool (NumPy
+releases the GIL and the results must land in this process's caches);
+images are drawn one after another because pyplot's state is global, and
+``figures.render`` serialises them with the sessions' own draws.
+
+Until a version is fully warm, ``serving`` keeps returning the previous
+one, so a refresh of the source files never puts a user on a cold path;
+the switch is a single assignment under the lock. The compute and plotting
+modules are imported on the warm-up thread, so creating a ``Warmer`` doesn't
+slow down the first page a session opens.
+"""
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import metrics
+
+log = logging.getLogger('nhl_app.warmup')
+
+POLL_SECONDS = 30
+
+
+def compute_tasks(frame, version):
+    """``(name, fn)`` pairs for the numeric artifacts; independent of each other."""
+    import correlation
+    import imputation
+    import modeling
+    import query
+    import similarity
+
+    tasks = [('query', lambda: query.codes_table(frame, version)),
+             ('similarity', lambda: (similarity.index(frame, version), similarity.labels(frame, version)))]
+    for method in correlation.METHODS:
+        tasks.append((f'correlation:{method}', lambda m=method: correlation.correlation(frame, version, method=m)))
+    for strategy in imputation.STRATEGIES:
+        tasks.append((f'impute:{strategy}', lambda s=strategy: correlation.correlation(
+            imputation.impute(frame, version, s, imputation.DEFAULT_COLS), version, strategy=s)))
+    features = [c for c in modeling.DEFAULT_FEATURES if c in frame.columns]
+    if features:
+        tasks.append(('modeling', lambda: (
+            modeling.fit(frame, features, alpha=modeling.DEFAULT_ALPHA, version=version),
+            modeling.cross_validate(frame, features, alpha=modeling.DEFAULT_ALPHA,
+                                    k=modeling.DEFAULT_FOLDS, version=version))))
+    return tasks
+
+
+def image_tasks(frame, version):
+    """``(name, fn)`` pairs for the rendered images, run after ``compute_tasks``."""
+    import numpy as np
+
+    import correlation
+    import figures
+    import imputation
+
+    numeric_cols = frame.select_dtypes(include=[np.number]).columns.tolist()
+    tasks = [('render:missing', lambda: figures.missing_image(frame, version)),
+             ('render:imputation:none', lambda: figures.imputation_image(frame, version))]
+    for strategy in imputation.STRATEGIES:
+        tasks.append((f'render:imputation:{strategy}',
+                      lambda s=strategy: figures.imputation_image(frame, version, s)))
+    for method in correlation.METHODS:
+        tasks.append((f'render:correlation:{method}',
+                      lambda m=method: figures.correlation_image(frame, version, m)))
+    if len(numeric_cols) > 1:
+        tasks.append(('render:pairplot', lambda: figures.pairplot_image(
+            frame, version, numeric_cols[:figures.PAIRPLOT_FEATURES])))
+    return tasks
+
+
+class Warmer:
+    """Warms each new dataset version in the background and swaps to it when done.
+
+    ``build(version)`` returns the merged frame; ``extra(frame, version)``
+    may add ``(name, fn)`` tasks of the caller's own (e.g. Streamlit-cached
+    functions) to the parallel stage.
+    """
+
+    def __init__(self, build, extra=None, workers=None):
+        self._build = build
+        self._extra = extra
+        self._workers = workers or min(8, os.cpu_count() or 1)
+        self._lock = threading.Lock()
+        self._active = None
+        self._pending = None
+        self._failed = None
+        self._done = 0
+        self._total = 0
+        self._errors = []
+
+    def serving(self):
+        """The newest fully warmed version, or None before the first one is ready."""
+        with self._lock:
+            return self._active
+
+    def progress(self):
+        with self._lock:
+            return {'serving': self._active, 'warming': self._pending, 'done': self._done,
+                    'total': self._total, 'errors': list(self._errors), 'failed': self._failed}
+
+    def ensure(self, version):
+        """Start warming ``version`` unless it is already served, warming, or failed to build."""
+        with self._lock:
+            if version in (self._active, self._pending, self._failed):
+                return
+            self._pending, self._done, self._total, self._errors = version, 0, 0, []
+        threading.Thread(target=self._run, args=(version,), daemon=True, name=f'warmup-{version}').start()
+
+    def watch(self, current, interval=POLL_SECONDS):
+        """Call ``ensure(current())`` now and then every ``interval`` seconds from a daemon thread."""
+        def loop():
+            while True:
+                try:
+                    self.ensure(current())
+                except Exception:
+                    log.exception("checking the source version failed")
+                time.sleep(interval)
+        threading.Thread(target=loop, daemon=True, name='warmup-watch').start()
+
+    def _step(self, version, name, fn):
+        with self._lock:
+            if self._pending != version:
+                return  # superseded by a newer version
+        try:
+            with metrics.timer(f'warmup:{name}'):
+                fn()
+        except Exception as exc:
+            # A failed artifact is still computed on demand by its page; it
+            # doesn't hold back the swap
+            log.exception("warming %s for %s failed", name, version)
+            with self._lock:
+                self._errors.append(f'{name}: {exc}')
+        with self._lock:
+            if self._pending == version:
+                self._done += 1
+
+    def _run(self, version):
+        try:
+            with metrics.timer('warmup:build'):
+                frame = self._build(version)
+        except Exception:
+            log.exception("building dataset %s failed", version)
+            with self._lock:
+                if self._pending == version:
+                    self._pending, self._failed = None, version
+            return
+        tasks = compute_tasks(frame, version) + list(self._extra(frame, version) if self._extra else [])
+        images = image_tasks(frame, version)
+        with self._lock:
+            if self._pending != version:
+                return
+            self._total = len(tasks) + len(images)
+        with metrics.timer('warmup'):
+            with ThreadPoolExecutor(max_workers=self._workers) as pool:
+                list(pool.map(lambda task: self._step(version, *task), tasks))
+            for task in images:
+                self._step(version, *task)
+        with self._lock:
+            # A newer version may have started warming meanwhile; only the
+            # version still pending gets swapped in
+            if self._pending != version:
+                return
+            self._active, self._pending = version, None
+        log.info("dataset %s is warm", version)